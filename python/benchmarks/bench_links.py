@@ -0,0 +1,116 @@
+"""Micro-benchmark: link extraction on a page with thousands of anchors.
+
+Compares the previous approach (BeautifulSoup parse, ``urljoin``/``urlparse``
+per anchor, base URL re-parsed inside the loop, dedupe on the raw absolute URL)
+with the lxml + ``LinkNormalizer`` pipeline.
+
+Usage:
+    python benchmarks/bench_links.py [anchors] [repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from botbrowser.core import _extract_links
+from botbrowser.links import LinkNormalizer
+
+BASE_URL = "https://www.example.com/news/section/"
+
+
+def build_page(anchors: int) -> str:
+    """A link-heavy page: relative, absolute, tracked and repeated hrefs."""
+    hrefs = []
+    for i in range(anchors):
+        kind = i % 6
+        if kind == 0:
+            hrefs.append(f"/article/{i % 800}")
+        elif kind == 1:
+            hrefs.append(f"https://www.example.com/article/{i % 800}/?utm_source=home&utm_medium=web")
+        elif kind == 2:
+            hrefs.append(f"HTTPS://WWW.EXAMPLE.COM:443/article/{i % 800}")
+        elif kind == 3:
+            hrefs.append(f"../tag/{i % 50}?b=2&a=1&fbclid=abc{i}")
+        elif kind == 4:
+            hrefs.append(f"https://cdn.example.net/assets/{i}.html")
+        else:
+            hrefs.append(f"#comment-{i}")
+    body = "".join(f'<li><a href="{h}">Link {i}</a></li>' for i, h in enumerate(hrefs))
+    return f"<html><head><title>Links</title></head><body><ul>{body}</ul></body></html>"
+
+
+def legacy_extract_links(html: str, base_url: str) -> list[tuple[str, str]]:
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    seen = set()
+    for a in soup.find_all("a", href=True):
+        try:
+            absolute_url = urljoin(base_url, a["href"])
+        except Exception:
+            continue
+        parsed = urlparse(absolute_url)
+        if parsed.scheme not in ("http", "https"):
+            continue
+        if parsed.fragment and parsed.path == urlparse(base_url).path:
+            continue
+        if absolute_url in seen:
+            continue
+        seen.add(absolute_url)
+        text = a.get_text(strip=True)
+        if text:
+            links.append((text, absolute_url))
+    return links
+
+
+def legacy_normalize(hrefs: list[str], base_url: str) -> set[str]:
+    seen = set()
+    for href in hrefs:
+        absolute_url = urljoin(base_url, href)
+        parsed = urlparse(absolute_url)
+        if parsed.scheme in ("http", "https") and not (
+            parsed.fragment and parsed.path == urlparse(base_url).path
+        ):
+            seen.add(absolute_url)
+    return seen
+
+
+def normalizer_normalize(hrefs: list[str], base_url: str) -> set[str]:
+    normalize = LinkNormalizer(base_url)
+    return {url for url in map(normalize, hrefs) if url is not None}
+
+
+def bench(label: str, fn, repeats: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeats))
+    print(f"  {label:<34} {best * 1000:8.2f} ms")
+    return best
+
+
+def main() -> None:
+    anchors = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    html = build_page(anchors)
+    hrefs = [a["href"] for a in BeautifulSoup(html, "html.parser").find_all("a", href=True)]
+
+    print(f"{anchors} anchors, best of {repeats}")
+
+    print("URL normalization only:")
+    old = bench("urljoin + urlparse (legacy)", lambda: legacy_normalize(hrefs, BASE_URL), repeats)
+    new = bench("LinkNormalizer", lambda: normalizer_normalize(hrefs, BASE_URL), repeats)
+    print(f"  speedup: {old / new:.1f}x")
+
+    print("Full link extraction:")
+    old = bench("BeautifulSoup + urljoin (legacy)", lambda: legacy_extract_links(html, BASE_URL), repeats)
+    new = bench("lxml + LinkNormalizer", lambda: _extract_links(html, BASE_URL), repeats)
+    print(f"  speedup: {old / new:.1f}x")
+
+    print("Unique links:")
+    print(f"  legacy (raw absolute URL):        {len(legacy_extract_links(html, BASE_URL))}")
+    print(f"  canonical:                        {len(_extract_links(html, BASE_URL))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,27 @@
 """BotBrowser — Token-efficient web content extraction for LLM agents."""
 
-from botbrowser.core import extract
+from botbrowser.core import extract, extract_from_html
+from botbrowser.streaming import aiter_extract, iter_extract, iter_extract_from_html
 from botbrowser.client import BotBrowserClient
-from botbrowser.models import BotBrowserResult, ExtractOptions, ExtractedLink, ExtractionMetadata
+from botbrowser.models import (
+    BotBrowserResult,
+    ExtractOptions,
+    ExtractedLink,
+    ExtractedSection,
+    ExtractionMetadata,
+)
 
 __version__ = "0.1.0"
 __all__ = [
     "extract",
+    "extract_from_html",
+    "iter_extract",
+    "iter_extract_from_html",
+    "aiter_extract",
     "BotBrowserClient",
     "BotBrowserResult",
     "ExtractOptions",
     "ExtractedLink",
+    "ExtractedSection",
     "ExtractionMetadata",
 ]
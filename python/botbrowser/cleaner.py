@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+import soupsieve
 from bs4 import BeautifulSoup, Comment, Tag
 
 REMOVE_TAGS = {
@@ -31,11 +34,40 @@ REMOVE_SELECTORS = [
     "[data-tracking]",
 ]
 
+# All selectors in one group, so the tree is walked once instead of per selector
+REMOVE_SELECTOR = ", ".join(REMOVE_SELECTORS)
+_REMOVE_MATCHER = soupsieve.compile(REMOVE_SELECTOR)
+# Owner of the detached tags built by ``is_removed_element``
+_MATCH_SOUP = BeautifulSoup("", "html.parser")
+
 STRIP_ATTR_PREFIXES = ("data-", "aria-", "on")
 
 SELF_CLOSING = {"img", "br", "hr", "input", "meta", "link"}
 
 
+def _is_hidden(attrs: Mapping[str, object]) -> bool:
+    if "hidden" in attrs:
+        return True
+    style = attrs.get("style", "")
+    if not isinstance(style, str):
+        return False
+    style = style.replace(" ", "")
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def is_removed_element(tag_name: str, attrs: Mapping[str, str]) -> bool:
+    """
+    Whether ``clean_html`` drops an element on its own tag and attributes.
+
+    Lets callers that split a document before cleaning (see
+    ``converter.iter_html_blocks``) decide whether a wrapper can be flattened
+    without losing a removal rule that applies to it.
+    """
+    if tag_name in REMOVE_TAGS or _is_hidden(attrs):
+        return True
+    return _REMOVE_MATCHER.match(_MATCH_SOUP.new_tag(tag_name, attrs=dict(attrs)))
+
+
 def clean_html(html: str) -> str:
     """Remove non-content elements and unnecessary attributes from HTML."""
     soup = BeautifulSoup(html, "html.parser")
@@ -44,31 +76,19 @@ def clean_html(html: str) -> str:
     for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
         comment.extract()
 
-    # Remove unwanted tags entirely
-    for tag_name in REMOVE_TAGS:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
+    # Remove unwanted tags entirely (one pass for all tag names)
+    for tag in soup.find_all(REMOVE_TAGS):
+        tag.decompose()
 
     # Remove non-content elements by selector
-    for selector in REMOVE_SELECTORS:
-        try:
-            for el in soup.select(selector):
-                el.decompose()
-        except Exception:
-            pass
+    for el in _REMOVE_MATCHER.select(soup):
+        el.decompose()
 
     # Remove hidden elements
     for el in soup.find_all(True):
         if not isinstance(el, Tag):
             continue
-        if el.has_attr("hidden"):
-            el.decompose()
-            continue
-        style = el.get("style", "")
-        if isinstance(style, str) and (
-            "display:none" in style.replace(" ", "")
-            or "visibility:hidden" in style.replace(" ", "")
-        ):
+        if _is_hidden(el.attrs):
             el.decompose()
 
     # Strip unnecessary attributes
@@ -0,0 +1,395 @@
+"""Command-line interface — bulk extraction with NDJSON output.
+
+Usage:
+    botbrowser https://example.com https://example.org
+    cat urls.txt | botbrowser --format text --fields url,title,content
+    botbrowser page.html --workers 0
+
+Each source (URL or local HTML path) produces exactly one JSON line on stdout,
+written as soon as that page completes. Failures are reported in-band as
+``{"url": ..., "error": ...}`` so a single bad page never stops the batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import unquote, urlparse
+
+from botbrowser import __version__
+from botbrowser.core import LOW_MEMORY_MAX_HTML_SIZE, extract_from_html
+from botbrowser.fetcher import fetch_page
+from botbrowser.models import BotBrowserResult
+from botbrowser.serialization import dumps_json
+
+RESULT_FIELDS = (
+    "url", "title", "description", "content", "text_content", "links", "metadata",
+)
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted work immediately in the calling process (``--workers 0``)."""
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:  # noqa: BLE001 — surfaced through the future
+            future.set_exception(exc)
+        return future
+
+
+def _iter_sources(args: list[str], stdin: IO[str]) -> Iterator[str]:
+    """Yield sources from the command line, or from stdin (one per line)."""
+    if args and args != ["-"]:
+        yield from args
+        return
+    for line in stdin:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _local_path(source: str) -> Path | None:
+    """Return a filesystem path if ``source`` is a local file rather than a URL."""
+    if source.startswith("file://"):
+        return Path(unquote(urlparse(source).path))
+    if "://" in source:
+        return None
+    return Path(source)
+
+
+def _fetch(
+    source: str,
+    timeout: int,
+    headers: dict[str, str] | None,
+    max_size: int | None,
+) -> tuple[str, str, bool]:
+    """Load a source and return ``(html, base_url, truncated)``."""
+    path = _local_path(source)
+    if path is not None:
+        # Limit in bytes, like fetch_page(max_bytes=...) for remote pages
+        with path.open("rb") as f:
+            body = f.read() if max_size is None else f.read(max_size + 1)
+        truncated = max_size is not None and len(body) > max_size
+        if truncated:
+            body = body[:max_size]
+        return body.decode("utf-8", errors="replace"), path.resolve().as_uri(), truncated
+    fetched = fetch_page(source, timeout=timeout, headers=headers, max_bytes=max_size)
+    return fetched.html, fetched.final_url, fetched.truncated
+
+
+def _extract_worker(
+    html: str,
+    url: str,
+    truncated: bool,
+    format: str,
+    include_links: bool,
+    low_memory: bool,
+    fast_path: bool,
+) -> BotBrowserResult:
+    """Top-level (picklable) entry point for the extraction process pool."""
+    result = extract_from_html(
+        html,
+        url,
+        format=format,
+        include_links=include_links,
+        low_memory=low_memory,
+        fast_path=fast_path,
+    )
+    result.metadata.truncated = result.metadata.truncated or truncated
+    return result
+
+
+def _parse_fields(value: str) -> tuple[str, ...]:
+    fields = tuple(f.strip() for f in value.split(",") if f.strip())
+    unknown = [f for f in fields if f not in RESULT_FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown field(s): {', '.join(unknown)} (choose from {', '.join(RESULT_FIELDS)})"
+        )
+    if not fields:
+        raise argparse.ArgumentTypeError("at least one field is required")
+    return fields
+
+
+def _parse_header(value: str) -> tuple[str, str]:
+    name, sep, header_value = value.partition(":")
+    if not sep or not name.strip():
+        raise argparse.ArgumentTypeError(f"expected 'Name: value', got {value!r}")
+    return name.strip(), header_value.strip()
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be >= 0")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="botbrowser",
+        description=(
+            "Extract clean, token-efficient content from web pages. "
+            "Reads URLs or local HTML paths from the arguments (or stdin) "
+            "and writes one JSON result per line."
+        ),
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        help="URLs or local HTML files. Reads one per line from stdin when omitted or '-'.",
+    )
+    parser.add_argument(
+        "-f", "--format",
+        choices=("markdown", "text"),
+        default="markdown",
+        help="content format (default: markdown)",
+    )
+    links = parser.add_mutually_exclusive_group()
+    links.add_argument(
+        "--include-links", dest="include_links", action="store_true", default=True,
+        help="extract links (default)",
+    )
+    links.add_argument(
+        "--no-links", dest="include_links", action="store_false",
+        help="skip link extraction",
+    )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=_positive_int,
+        default=8,
+        help="maximum number of pages fetched at once (default: 8)",
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=_non_negative_int,
+        default=os.cpu_count() or 1,
+        help="extraction processes; 0 extracts in the main process (default: CPU count)",
+    )
+    parser.add_argument(
+        "--fields",
+        type=_parse_fields,
+        default=RESULT_FIELDS,
+        help=f"comma-separated result fields to output (default: {','.join(RESULT_FIELDS)})",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="memory-bounded extraction for very large pages (reports peak memory)",
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        dest="fast_path",
+        action="store_false",
+        help="always run trafilatura, even when the page exposes its article as structured data",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=_positive_int,
+        default=None,
+        metavar="BYTES",
+        help="truncate pages larger than this many bytes (default: 16 MiB with --low-memory, else unlimited)",
+    )
+    parser.add_argument(
+        "-t", "--timeout",
+        type=_positive_int,
+        default=15000,
+        help="request timeout in ms (default: 15000)",
+    )
+    parser.add_argument(
+        "-H", "--header",
+        dest="headers",
+        type=_parse_header,
+        action="append",
+        default=[],
+        metavar="'NAME: VALUE'",
+        help="extra request header (repeatable)",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser
+
+
+def run(
+    sources: Iterable[str],
+    out: IO[str],
+    *,
+    format: str = "markdown",
+    include_links: bool = True,
+    concurrency: int = 8,
+    workers: int = 1,
+    fields: Iterable[str] = RESULT_FIELDS,
+    timeout: int = 15000,
+    headers: dict[str, str] | None = None,
+    low_memory: bool = False,
+    max_size: int | None = None,
+    fast_path: bool = True,
+) -> int:
+    """
+    Fetch and extract every source, writing one JSON line per page to ``out``.
+
+    Fetches run on a thread pool bounded by ``concurrency``; extraction runs on
+    a pool of ``workers`` processes. Sources are consumed lazily, so at most
+    ``concurrency`` fetches and ``2 * workers`` extractions are in flight at
+    any time regardless of input size. If a worker process dies (e.g. killed
+    for running out of memory), the pages in flight are reported as failures
+    and a new pool takes over. Returns the number of failed sources.
+    """
+    fields = set(fields)
+    if max_size is None and low_memory:
+        max_size = LOW_MEMORY_MAX_HTML_SIZE
+    extract_slots = max(workers, 1) * 2
+    failures = 0
+
+    def new_extract_pool() -> Executor:
+        if not workers:
+            return _InlineExecutor()
+        # Spawn (never fork) the workers: forking while fetch threads hold
+        # httpx/ssl locks can deadlock the child
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    extract_pool = new_extract_pool()
+    fetch_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="botbrowser-fetch")
+
+    fetching: dict[Future, str] = {}
+    extracting: dict[Future, str] = {}
+    # Fetched pages waiting for a free extraction slot
+    ready: list[tuple[str, tuple[str, str, bool]]] = []
+    source_iter = iter(sources)
+    exhausted = False
+
+    def emit(line: str) -> None:
+        out.write(line + "\n")
+        out.flush()
+
+    def emit_error(source: str, exc: BaseException) -> None:
+        nonlocal failures
+        failures += 1
+        emit(dumps_json({"url": source, "error": f"{type(exc).__name__}: {exc}"}).decode())
+
+    def emit_extracted(source: str, future: Future) -> None:
+        try:
+            result: BotBrowserResult = future.result()
+        except Exception as exc:
+            emit_error(source, exc)
+        else:
+            emit(result.model_dump_json(include=fields))
+
+    def replace_broken_pool(exc: BrokenProcessPool) -> None:
+        """A worker died (e.g. OOM-killed): fail what was in flight and start a new pool."""
+        nonlocal extract_pool
+        for future, source in extracting.items():
+            if future.done() and not future.exception():
+                emit_extracted(source, future)
+            else:
+                emit_error(source, exc)
+        extracting.clear()
+        extract_pool.shutdown(wait=False, cancel_futures=True)
+        extract_pool = new_extract_pool()
+
+    try:
+        while True:
+            while not exhausted and len(fetching) + len(ready) < concurrency:
+                try:
+                    source = next(source_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                fetching[fetch_pool.submit(_fetch, source, timeout, headers, max_size)] = source
+
+            while ready and len(extracting) < extract_slots:
+                source, page = ready.pop(0)
+                try:
+                    future = extract_pool.submit(
+                        _extract_worker, *page, format, include_links, low_memory, fast_path
+                    )
+                except BrokenProcessPool as exc:
+                    # Counted as in flight, so a pool that keeps dying still makes progress
+                    emit_error(source, exc)
+                    replace_broken_pool(exc)
+                else:
+                    extracting[future] = source
+
+            if not fetching and not extracting:
+                break
+
+            done, _ = wait([*fetching, *extracting], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    source = fetching.pop(future)
+                    try:
+                        page = future.result()
+                    except Exception as exc:
+                        emit_error(source, exc)
+                    else:
+                        ready.append((source, page))
+                elif future in extracting:
+                    source = extracting.pop(future)
+                    exc = future.exception()
+                    if isinstance(exc, BrokenProcessPool):
+                        emit_error(source, exc)
+                        replace_broken_pool(exc)
+                    else:
+                        emit_extracted(source, future)
+                # Otherwise already reported when its pool was replaced
+    finally:
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+        extract_pool.shutdown(wait=False, cancel_futures=True)
+
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the ``botbrowser`` console script."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        failures = run(
+            _iter_sources(args.sources, sys.stdin),
+            sys.stdout,
+            format=args.format,
+            include_links=args.include_links,
+            concurrency=args.concurrency,
+            workers=args.workers,
+            fields=args.fields,
+            timeout=args.timeout,
+            headers=dict(args.headers) or None,
+            low_memory=args.low_memory,
+            max_size=args.max_size,
+            fast_path=args.fast_path,
+        )
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Downstream closed the pipe (e.g. `| head`); stop quietly
+        sys.stderr.close()
+        return 0
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
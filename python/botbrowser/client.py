@@ -40,27 +40,9 @@ class BotBrowserClient:
             },
         )
         response.raise_for_status()
-        data = response.json()
 
-        # Map camelCase API response to snake_case Python model
-        return BotBrowserResult(
-            url=data["url"],
-            title=data["title"],
-            description=data["description"],
-            content=data["content"],
-            text_content=data.get("textContent", data.get("text_content", "")),
-            links=[
-                {"text": link["text"], "href": link["href"]}
-                for link in data.get("links", [])
-            ],
-            metadata={
-                "raw_token_estimate": data["metadata"].get("rawTokenEstimate", data["metadata"].get("raw_token_estimate", 0)),
-                "clean_token_estimate": data["metadata"].get("cleanTokenEstimate", data["metadata"].get("clean_token_estimate", 0)),
-                "token_savings_percent": data["metadata"].get("tokenSavingsPercent", data["metadata"].get("token_savings_percent", 0)),
-                "word_count": data["metadata"].get("wordCount", data["metadata"].get("word_count", 0)),
-                "fetched_at": data["metadata"].get("fetchedAt", data["metadata"].get("fetched_at", "")),
-            },
-        )
+        # camelCase API keys are accepted through the models' validation aliases
+        return BotBrowserResult.model_validate_json(response.content)
 
     def health(self) -> dict:
         """Check server health."""
@@ -3,9 +3,29 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from html import escape
 
+from lxml import etree
+from lxml import html as lxml_html
 from markdownify import markdownify
 
+from botbrowser.cleaner import is_removed_element
+
+# Wrappers that are flattened into their children when splitting a document
+# into blocks, unless the cleaner would remove the wrapper itself
+WRAPPER_TAGS = {"html", "body", "div", "section", "article", "main"}
+
+HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+
+INLINE_TAGS = {
+    "a", "abbr", "b", "br", "cite", "code", "del", "dfn", "em", "i", "img",
+    "ins", "kbd", "mark", "q", "s", "samp", "small", "span", "strong", "sub",
+    "sup", "time", "u", "var",
+}
+
+_HAS_HEADING = etree.XPath("boolean(.//h1 | .//h2 | .//h3 | .//h4 | .//h5 | .//h6)")
+
 
 def html_to_markdown(html: str) -> str:
     """Convert HTML to clean markdown."""
@@ -31,8 +51,11 @@ def html_to_markdown(html: str) -> str:
 
 def html_to_text(html: str) -> str:
     """Convert HTML to plain text."""
-    markdown = html_to_markdown(html)
+    return markdown_to_text(html_to_markdown(html))
+
 
+def markdown_to_text(markdown: str) -> str:
+    """Strip markdown syntax, leaving plain text."""
     text = markdown
     text = re.sub(r"#{1,6}\s+", "", text)  # Remove heading markers
     text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)  # Remove bold
@@ -47,3 +70,87 @@ def html_to_text(html: str) -> str:
     text = re.sub(r"\n{3,}", "\n\n", text)
 
     return text.strip()
+
+
+def _iter_blocks(root: lxml_html.HtmlElement, split_headings: bool) -> Iterator[tuple[int, str]]:
+    """Yield ``(heading_level, html)`` for each block under ``root``; level 0 is not a heading."""
+    inline: list[str] = []
+
+    if root.text and root.text.strip():
+        inline.append(escape(root.text, quote=False))
+
+    for child in root:
+        tag = child.tag
+        if not isinstance(tag, str):
+            pass  # Comments and processing instructions; only their tail matters
+        elif tag in HEADING_LEVELS:
+            if inline:
+                yield 0, "".join(inline)
+                inline = []
+            yield HEADING_LEVELS[tag], lxml_html.tostring(child, encoding="unicode", with_tail=False)
+        elif (
+            tag in WRAPPER_TAGS or (split_headings and _HAS_HEADING(child))
+        ) and not is_removed_element(tag, child.attrib):
+            if inline:
+                yield 0, "".join(inline)
+                inline = []
+            yield from _iter_blocks(child, split_headings)
+        elif tag in INLINE_TAGS:
+            inline.append(lxml_html.tostring(child, encoding="unicode", with_tail=False))
+        else:
+            if inline:
+                yield 0, "".join(inline)
+                inline = []
+            yield 0, lxml_html.tostring(child, encoding="unicode", with_tail=False)
+
+        if child.tail and child.tail.strip():
+            inline.append(escape(child.tail, quote=False))
+
+    if inline:
+        yield 0, "".join(inline)
+
+
+def iter_html_blocks(root: lxml_html.HtmlElement) -> Iterator[str]:
+    """
+    Yield the HTML of each top-level content block under ``root``, in order.
+
+    ``root`` itself and the wrappers inside it (``div``, ``section``, ...) are
+    flattened so a single outer wrapper never becomes one huge block, and
+    consecutive inline content is grouped into one block. Wrappers the cleaner
+    removes outright (``<div class="sidebar">``, hidden elements, ...) stay
+    whole so that ``clean_html`` still drops them. Each block can be cleaned and
+    converted on its own, keeping only one small parse tree alive at a time.
+    """
+    for _, block in _iter_blocks(root, split_headings=False):
+        yield block
+
+
+def iter_heading_blocks(root: lxml_html.HtmlElement) -> Iterator[tuple[int, str]]:
+    """
+    Like :func:`iter_html_blocks`, but every heading becomes a block of its own.
+
+    Any element that contains a heading (a ``<ul>`` of cards, a layout
+    ``<table>``, ...) is flattened as well, unless the cleaner removes it.
+    Yields ``(level, html)`` where ``level`` is the heading level (1-6), or 0
+    for blocks that are not headings.
+    """
+    return _iter_blocks(root, split_headings=True)
+
+
+def iter_html_chunks(root: lxml_html.HtmlElement, max_chars: int) -> Iterator[str]:
+    """
+    Yield :func:`iter_html_blocks` output joined into chunks of about ``max_chars``.
+
+    Cleaning and converting a chunk costs about the same per character as a
+    whole page, without the fixed per-call overhead of one tiny block at a time.
+    """
+    chunk: list[str] = []
+    size = 0
+    for block in iter_html_blocks(root):
+        chunk.append(block)
+        size += len(block)
+        if size >= max_chars:
+            yield "".join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk)
@@ -2,23 +2,76 @@
 
 from __future__ import annotations
 
+import gc
+import inspect
 import math
+import re
+import sys
+import threading
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from botbrowser.cleaner import clean_html
-from botbrowser.converter import html_to_markdown, html_to_text
+from botbrowser.converter import (
+    html_to_markdown,
+    iter_html_chunks,
+    markdown_to_text,
+)
+from botbrowser.fastpath import find_main_content, record_path
 from botbrowser.fetcher import fetch_page
+from botbrowser.links import LinkNormalizer
 from botbrowser.models import (
     BotBrowserResult,
     ExtractedLink,
     ExtractionMetadata,
+    ExtractionPath,
     ExtractOptions,
 )
 
 import trafilatura
+from trafilatura.utils import load_html
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+# Anchor text, minus script/style/template contents (as get_text() skipped them)
+_ANCHOR_TEXT = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+_WORD_RE = re.compile(r"\S+")
+
+# Elements trafilatura discards anyway, dropped from the tree before it makes its
+# copies in low-memory mode (JSON-LD stays: trafilatura reads it)
+_TRAFILATURA_DISCARDED = etree.XPath(
+    "//script[not(@type='application/ld+json')] | //style | //noscript | //svg | //iframe"
+    " | //comment()"
+)
+
+# Default per-document HTML size limit (characters) in low-memory mode
+LOW_MEMORY_MAX_HTML_SIZE = 16 * 1024 * 1024
+# Main content is cleaned and converted in chunks of about this many characters
+LOW_MEMORY_CHUNK_SIZE = 8 * 1024
+
+# Skip trafilatura's fallback extractors in low-memory mode; the flag was
+# renamed from ``no_fallback`` to ``fast`` in trafilatura 2.0
+_TRAFILATURA_FAST = (
+    {"fast": True}
+    if "fast" in inspect.signature(trafilatura.extract).parameters
+    else {"no_fallback": True}
+)
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
 
 
 def _estimate_tokens(text: str) -> int:
@@ -26,6 +79,11 @@ def _estimate_tokens(text: str) -> int:
     return math.ceil(len(text) / 4)
 
 
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
 def _extract_description(html: str) -> str:
     """Extract meta description from HTML."""
     soup = BeautifulSoup(html, "html.parser")
@@ -55,39 +113,147 @@ def _extract_title(html: str) -> str:
     return ""
 
 
-def _extract_links(html: str, base_url: str) -> list[ExtractedLink]:
+def _extract_links(
+    html: str,
+    base_url: str,
+    tracking_params: Iterable[str] | None = None,
+) -> list[ExtractedLink]:
     """Extract unique links from HTML content."""
-    soup = BeautifulSoup(html, "html.parser")
+    if not html.strip():
+        return []
+    try:
+        tree = lxml_html.fromstring(html)
+    except ValueError:
+        # Unicode strings with an XML encoding declaration must be parsed as bytes
+        tree = lxml_html.fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return []
+    return _tree_links(tree, base_url, tracking_params)
+
+
+def _tree_title(tree: lxml_html.HtmlElement) -> str:
+    """Extract page title from a parsed lxml tree."""
+    title_tag = tree.find(".//title")
+    if title_tag is not None and title_tag.text and len(title_tag) == 0:
+        return title_tag.text.strip()
+
+    og_title = tree.xpath('(.//meta[@property="og:title"])[1]/@content')
+    return str(og_title[0]) if og_title and og_title[0] else ""
+
+
+def _tree_description(tree: lxml_html.HtmlElement) -> str:
+    """Extract meta description from a parsed lxml tree."""
+    for xpath in (
+        '(.//meta[@name="description"])[1]/@content',
+        '(.//meta[@property="og:description"])[1]/@content',
+    ):
+        content = tree.xpath(xpath)
+        if content and content[0]:
+            return str(content[0])
+    return ""
+
+
+def _tree_links(
+    tree: lxml_html.HtmlElement,
+    base_url: str,
+    tracking_params: Iterable[str] | None = None,
+) -> list[ExtractedLink]:
+    """Extract unique links from a parsed lxml tree, deduped on their canonical URL."""
+    normalize = LinkNormalizer(base_url, tracking_params=tracking_params)
     links: list[ExtractedLink] = []
     seen: set[str] = set()
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-
-        # Resolve relative URLs
-        try:
-            absolute_url = urljoin(base_url, href)
-        except Exception:
+    for a in tree.iter("a"):
+        href = a.get("href")
+        if href is None:
             continue
 
-        # Skip non-HTTP, anchors, mailto, tel
-        parsed = urlparse(absolute_url)
-        if parsed.scheme not in ("http", "https"):
-            continue
-        if parsed.fragment and parsed.path == urlparse(base_url).path:
+        # Skip non-HTTP, same-page anchors, mailto, tel
+        url = normalize(href)
+        if url is None or url in seen:
             continue
 
-        if absolute_url in seen:
-            continue
-        seen.add(absolute_url)
-
-        text = a.get_text(strip=True)
+        if len(a):
+            text = "".join(s.strip() for s in _ANCHOR_TEXT(a))
+        else:
+            text = a.text.strip() if a.text else ""
         if text:
-            links.append(ExtractedLink(text=text, href=absolute_url))
+            seen.add(url)
+            links.append(ExtractedLink(text=text, href=url))
 
     return links
 
 
+def _peak_rss() -> int | None:
+    """Return the process's peak resident set size in bytes, if known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def _track_peak_memory(trace: bool = False) -> Iterator[list[int | None]]:
+    """
+    Measure the peak memory growth inside the block.
+
+    Yields a one-element list that holds the peak (in bytes) once the block
+    exits. By default this is how far the block raised the process's peak
+    RSS: it costs nothing and includes C allocations (lxml), but reads 0 when
+    the process had already peaked higher, and ``None`` where ``resource`` is
+    unavailable. With ``trace``, the Python heap growth is measured with
+    ``tracemalloc`` instead. Tracing is per-process: it slows every thread
+    while active and resets the tracemalloc peak of any caller already tracing.
+    """
+    peak: list[int | None] = [None]
+    if not trace:
+        baseline = _peak_rss()
+        try:
+            yield peak
+        finally:
+            current = _peak_rss()
+            if baseline is not None and current is not None:
+                peak[0] = current - baseline
+        return
+
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_users = 1
+        elif _tracemalloc_users:
+            _tracemalloc_users += 1
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    try:
+        yield peak
+    finally:
+        with _tracemalloc_lock:
+            peak[0] = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            if _tracemalloc_users:
+                _tracemalloc_users -= 1
+                if _tracemalloc_users == 0:
+                    tracemalloc.stop()
+
+
+def _normalize_options(
+    url_or_options: str | ExtractOptions | None,
+    *,
+    url: str | None,
+    **kwargs: object,
+) -> ExtractOptions:
+    """Build ``ExtractOptions`` from the positional/keyword calling styles."""
+    if isinstance(url_or_options, ExtractOptions):
+        return url_or_options
+    if isinstance(url_or_options, str):
+        return ExtractOptions(url=url_or_options, **kwargs)  # type: ignore[arg-type]
+    if url is not None:
+        return ExtractOptions(url=url, **kwargs)  # type: ignore[arg-type]
+    raise ValueError("url is required")
+
+
 def extract(
     url_or_options: str | ExtractOptions | None = None,
     *,
@@ -96,6 +262,11 @@ def extract(
     timeout: int = 15000,
     include_links: bool = True,
     headers: dict[str, str] | None = None,
+    low_memory: bool = False,
+    max_html_size: int | None = None,
+    trace_memory: bool = False,
+    fast_path: bool = True,
+    tracking_params: Iterable[str] | None = None,
 ) -> BotBrowserResult:
     """
     Extract clean, token-efficient content from a web page.
@@ -104,64 +275,170 @@ def extract(
         result = extract("https://example.com")
         result = extract("https://example.com", format="text")
         result = extract(ExtractOptions(url="https://example.com"))
+        result = extract("https://example.com/huge", low_memory=True)
     """
-    # Normalize arguments
-    if isinstance(url_or_options, ExtractOptions):
-        opts = url_or_options
-    elif isinstance(url_or_options, str):
-        opts = ExtractOptions(
-            url=url_or_options,
-            format=format,  # type: ignore[arg-type]
-            timeout=timeout,
-            include_links=include_links,
-            headers=headers,
+    opts = _normalize_options(
+        url_or_options,
+        url=url,
+        format=format,
+        timeout=timeout,
+        include_links=include_links,
+        headers=headers,
+        low_memory=low_memory,
+        max_html_size=max_html_size,
+        trace_memory=trace_memory,
+        fast_path=fast_path,
+        tracking_params=list(tracking_params) if tracking_params is not None else None,
+    )
+
+    max_size = opts.max_html_size
+    if max_size is None and opts.low_memory:
+        max_size = LOW_MEMORY_MAX_HTML_SIZE
+
+    # Step 1: Fetch the page (stops reading at the size limit)
+    fetched = fetch_page(
+        opts.url, timeout=opts.timeout, headers=opts.headers, max_bytes=max_size
+    )
+
+    if opts.low_memory:
+        # Hand the only reference to the raw HTML over to the pipeline
+        buffer = [fetched.html]
+        final_url, truncated = fetched.final_url, fetched.truncated
+        del fetched
+        return _extract_low_memory(
+            buffer,
+            final_url,
+            format=opts.format,
+            include_links=opts.include_links,
+            max_html_size=max_size,
+            trace_memory=opts.trace_memory,
+            fast_path=opts.fast_path,
+            tracking_params=opts.tracking_params,
+            truncated=truncated,
         )
-    elif url is not None:
-        opts = ExtractOptions(
-            url=url,
-            format=format,  # type: ignore[arg-type]
-            timeout=timeout,
+
+    return _extract_standard(
+        fetched.html,
+        fetched.final_url,
+        format=opts.format,
+        include_links=opts.include_links,
+        fast_path=opts.fast_path,
+        tracking_params=opts.tracking_params,
+        truncated=fetched.truncated,
+    )
+
+
+def extract_from_html(
+    html: str,
+    url: str = "",
+    *,
+    format: str = "markdown",
+    include_links: bool = True,
+    low_memory: bool = False,
+    max_html_size: int | None = None,
+    trace_memory: bool = False,
+    fast_path: bool = True,
+    tracking_params: Iterable[str] | None = None,
+) -> BotBrowserResult:
+    """
+    Extract clean, token-efficient content from already-fetched HTML.
+
+    ``url`` is used as the base for resolving relative links and is reported
+    back as ``result.url``. HTML longer than ``max_html_size`` characters is
+    truncated (``metadata.truncated`` is set). In ``low_memory`` mode the
+    caller's ``html`` string is the only copy left alive beyond the first
+    stage, so drop your own reference first when possible. Low-memory results
+    report ``metadata.peak_memory_bytes`` (peak RSS growth, or Python heap
+    growth via ``tracemalloc`` with ``trace_memory``).
+
+    Usage:
+        result = extract_from_html(html, "https://example.com/article")
+    """
+    if low_memory:
+        return _extract_low_memory(
+            [html],
+            url,
+            format=format,
             include_links=include_links,
-            headers=headers,
+            max_html_size=max_html_size if max_html_size is not None else LOW_MEMORY_MAX_HTML_SIZE,
+            trace_memory=trace_memory,
+            fast_path=fast_path,
+            tracking_params=tracking_params,
         )
-    else:
-        raise ValueError("url is required")
 
-    # Step 1: Fetch the page
-    fetched = fetch_page(opts.url, timeout=opts.timeout, headers=opts.headers)
-    raw_token_estimate = _estimate_tokens(fetched.html)
+    truncated = max_html_size is not None and len(html) > max_html_size
+    if truncated:
+        html = html[:max_html_size]
+    return _extract_standard(
+        html,
+        url,
+        format=format,
+        include_links=include_links,
+        fast_path=fast_path,
+        tracking_params=tracking_params,
+        truncated=truncated,
+    )
 
-    # Step 2: Extract metadata from raw HTML
-    title = _extract_title(fetched.html)
-    description = _extract_description(fetched.html)
 
-    # Step 3: Extract main content using trafilatura
+def _main_content(
+    document: str | lxml_html.HtmlElement,
+    url: str,
+    *,
+    fast_path: bool,
+    low_memory: bool = False,
+) -> tuple[ExtractionPath, str | None]:
+    """
+    Locate the main content and return ``(path, html)``.
+
+    With ``fast_path`` and a parsed ``document``, structured data (JSON-LD or a
+    single dominant ``<article>``/``<main>``) is tried before trafilatura. The
+    HTML is ``None`` when nothing was found and the full page must be used.
+    """
+    if fast_path and not isinstance(document, str):
+        found = find_main_content(document, url)
+        if found:
+            return found
+
+    if low_memory and not isinstance(document, str):
+        # trafilatura copies the tree several times, so shrink it first
+        for node in _TRAFILATURA_DISCARDED(document):
+            node.drop_tree()
+
+    # trafilatura works on its own copy of a parsed tree
     main_content_html = trafilatura.extract(
-        fetched.html,
+        document,
         output_format="html",
         include_links=True,
         include_tables=True,
         include_formatting=True,
+        **(_TRAFILATURA_FAST if low_memory else {}),
     )
+    path: ExtractionPath = "trafilatura" if main_content_html else "full_page"
+    if fast_path:
+        record_path(url, path)
+    return path, main_content_html or None
 
-    # Step 4: Clean HTML
-    if main_content_html:
-        cleaned_html = clean_html(main_content_html)
-    else:
-        # Fallback: clean the full page HTML
-        cleaned_html = clean_html(fetched.html)
-
-    # Step 5: Convert to desired format
-    if opts.format == "markdown":
-        content = html_to_markdown(cleaned_html)
-    else:
-        content = html_to_text(cleaned_html)
 
-    text_content = html_to_text(cleaned_html)
+def _content_root(path: ExtractionPath, html: str) -> lxml_html.HtmlElement:
+    """Parse main-content HTML into the element whose children are its blocks."""
+    if path == "article":
+        # The <article>/<main> element itself, so it is always flattened
+        return lxml_html.fragment_fromstring(html)
+    return lxml_html.document_fromstring(html)
 
-    # Step 6: Extract links from raw HTML (not cleaned — cleaning strips nav links)
-    links = _extract_links(fetched.html, fetched.final_url) if opts.include_links else []
 
+def _build_result(
+    *,
+    url: str,
+    title: str,
+    description: str,
+    content: str,
+    text_content: str,
+    links: list[ExtractedLink],
+    raw_token_estimate: int,
+    truncated: bool,
+    extraction_path: ExtractionPath,
+) -> BotBrowserResult:
     clean_token_estimate = _estimate_tokens(content)
     savings = (
         round((1 - clean_token_estimate / raw_token_estimate) * 100)
@@ -170,7 +447,7 @@ def extract(
     )
 
     return BotBrowserResult(
-        url=fetched.final_url,
+        url=url,
         title=title,
         description=description,
         content=content,
@@ -180,7 +457,161 @@ def extract(
             raw_token_estimate=raw_token_estimate,
             clean_token_estimate=clean_token_estimate,
             token_savings_percent=savings,
-            word_count=len(text_content.split()),
+            word_count=_count_words(text_content),
             fetched_at=datetime.now(timezone.utc).isoformat(),
+            truncated=truncated,
+            extraction_path=extraction_path,
         ),
     )
+
+
+def _extract_standard(
+    html: str,
+    url: str,
+    *,
+    format: str,
+    include_links: bool,
+    fast_path: bool = True,
+    tracking_params: Iterable[str] | None = None,
+    truncated: bool = False,
+) -> BotBrowserResult:
+    raw_token_estimate = _estimate_tokens(html)
+
+    # Step 2: Extract metadata from raw HTML
+    title = _extract_title(html)
+    description = _extract_description(html)
+
+    # Parse once with lxml for the fast path, trafilatura and links
+    tree = load_html(html) if html.strip() else None
+
+    # Step 3: Extract main content (structured data when available, else trafilatura)
+    extraction_path, main_content_html = _main_content(
+        tree if tree is not None else html, url, fast_path=fast_path
+    )
+
+    # Step 4: Clean HTML
+    if main_content_html:
+        cleaned_html = clean_html(main_content_html)
+    else:
+        # Fallback: clean the full page HTML
+        cleaned_html = clean_html(html)
+
+    # Step 5: Convert to desired format (text is derived from the markdown)
+    markdown = html_to_markdown(cleaned_html)
+    text_content = markdown_to_text(markdown)
+    content = markdown if format == "markdown" else text_content
+
+    # Step 6: Extract links from raw HTML (not cleaned — cleaning strips nav links)
+    if not include_links:
+        links = []
+    elif tree is not None:
+        links = _tree_links(tree, url, tracking_params)
+    else:
+        links = _extract_links(html, url, tracking_params)
+    del tree
+
+    return _build_result(
+        url=url,
+        title=title,
+        description=description,
+        content=content,
+        text_content=text_content,
+        links=links,
+        raw_token_estimate=raw_token_estimate,
+        truncated=truncated,
+        extraction_path=extraction_path,
+    )
+
+
+def _extract_low_memory(
+    buffer: list[str],
+    url: str,
+    *,
+    format: str,
+    include_links: bool,
+    max_html_size: int,
+    trace_memory: bool = False,
+    fast_path: bool = True,
+    tracking_params: Iterable[str] | None = None,
+    truncated: bool = False,
+) -> BotBrowserResult:
+    """
+    Memory-bounded pipeline.
+
+    The page is parsed once (with lxml) for title, description, links and
+    trafilatura instead of once per helper, the main content is cleaned and
+    converted in small chunks, and each intermediate is dropped as soon as the
+    next stage has consumed it. ``buffer`` holds the raw HTML and is emptied,
+    so the caller keeps no reference to it.
+    """
+    with _track_peak_memory(trace_memory) as peak:
+        html = buffer.pop()
+        if len(html) > max_html_size:
+            html = html[:max_html_size]
+            truncated = True
+        raw_token_estimate = _estimate_tokens(html)
+
+        tree = load_html(html) if html.strip() else None
+        if tree is None:
+            # Not parseable as a document: the input is tiny or junk anyway
+            result = _extract_standard(
+                html,
+                url,
+                format=format,
+                include_links=include_links,
+                fast_path=fast_path,
+                tracking_params=tracking_params,
+                truncated=truncated,
+            )
+            del html
+        else:
+            del html
+
+            title = _tree_title(tree)
+            description = _tree_description(tree)
+            links = _tree_links(tree, url, tracking_params) if include_links else []
+
+            extraction_path, main_content_html = _main_content(
+                tree, url, fast_path=fast_path, low_memory=True
+            )
+            if main_content_html:
+                del tree
+                content_root = _content_root(extraction_path, main_content_html)
+                del main_content_html
+            else:
+                # Fallback: the full page body
+                content_root = tree.body if tree.body is not None else tree
+                del tree
+
+            # Clean and convert chunk by chunk so only one small soup is alive
+            parts: list[str] = []
+            for chunk_html in iter_html_chunks(content_root, LOW_MEMORY_CHUNK_SIZE):
+                chunk_markdown = html_to_markdown(clean_html(chunk_html))
+                if chunk_markdown:
+                    parts.append(chunk_markdown)
+                # BeautifulSoup trees are reference cycles: free each chunk's
+                # soups now instead of letting them pile up until the next GC
+                gc.collect(0)
+            del content_root
+
+            markdown = "\n\n".join(parts)
+            del parts
+
+            text_content = markdown_to_text(markdown)
+            content = markdown if format == "markdown" else text_content
+            del markdown
+
+            result = _build_result(
+                url=url,
+                title=title,
+                description=description,
+                content=content,
+                text_content=text_content,
+                links=links,
+                raw_token_estimate=raw_token_estimate,
+                truncated=truncated,
+                extraction_path=extraction_path,
+            )
+
+    result.metadata.peak_memory_bytes = peak[0]
+    return result
@@ -0,0 +1,288 @@
+"""Structured-data fast path — take the article directly when the page exposes it.
+
+Many pages already carry their full article in JSON-LD (``articleBody``) or in a
+single clean ``<article>``/``<main>`` element. For those, the content can be taken
+directly instead of running trafilatura's full scoring pass. Which path worked
+is remembered per host: after several misses in a row a host's pages skip the
+probes, apart from an occasional re-probe in case the site's templates differ.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from html import escape
+from typing import Optional
+from urllib.parse import urlparse
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from botbrowser.models import ExtractionPath
+
+# Minimum visible characters for a structured candidate to be trusted
+MIN_ARTICLE_CHARS = 500
+# An <article>/<main> must hold at least this share of the page's visible text
+MIN_TEXT_SHARE = 0.5
+# ...and at most this share of its own text may be link text
+MAX_LINK_DENSITY = 0.3
+# JSON-LD articleBody must be at least this long relative to the page's
+# article element (guards against teaser-only bodies on paywalled pages)
+MIN_JSON_LD_COVERAGE = 0.5
+# ...and an <article>/<main> shorter than this share of the articleBody is
+# itself the teaser, so JSON-LD wins even though the element passed its checks
+MIN_ARTICLE_COVERAGE = 0.5
+# Hosts stop being probed after this many misses in a row...
+PROBE_MISS_LIMIT = 3
+# ...except for one page in this many, which is probed anyway
+REPROBE_INTERVAL = 20
+
+_ALL_TEXT = etree.XPath(".//text()", smart_strings=False)
+# A text()[not(ancestor::...)] filter is quadratic in libxml2 on large pages,
+# so invisible text is measured separately and subtracted instead
+_INVISIBLE_TEXT = etree.XPath(
+    ".//script//text() | .//style//text() | .//noscript//text() | .//template//text()",
+    smart_strings=False,
+)
+_LINK_TEXT = etree.XPath(".//a//text()", smart_strings=False)
+_JSON_LD_SCRIPTS = etree.XPath(
+    "//script[translate(normalize-space(@type), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+    "'abcdefghijklmnopqrstuvwxyz')='application/ld+json']",
+    smart_strings=False,
+)
+
+
+class DomainPathCache:
+    """
+    Bounded, thread-safe LRU map of host -> structured-data probe history.
+
+    Each host keeps the probe that last succeeded (tried first on its next
+    page), how many pages in a row missed the probes, and how many pages
+    skipped probing since.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        # host -> [last successful probe, consecutive misses, pages skipped since last probe]
+        self._paths: OrderedDict[str, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> Optional[str]:
+        """Return the probe (``"json_ld"`` or ``"article"``) that last succeeded for ``host``."""
+        with self._lock:
+            entry = self._paths.get(host)
+            if entry is None:
+                return None
+            self._paths.move_to_end(host)
+            return entry[0]
+
+    def should_probe(self, host: str) -> bool:
+        """Whether the next page from ``host`` should try the probes."""
+        with self._lock:
+            entry = self._paths.get(host)
+            if entry is None or entry[1] < PROBE_MISS_LIMIT:
+                return True
+            entry[2] += 1
+            if entry[2] >= REPROBE_INTERVAL:
+                entry[2] = 0
+                return True
+            return False
+
+    def record(self, host: str, path: str) -> None:
+        """Record the path used for a page; trafilatura/full_page count as misses."""
+        if not host:
+            return
+        with self._lock:
+            entry = self._paths.get(host)
+            if entry is None:
+                entry = self._paths[host] = [None, 0, 0]
+            if path in _PROBES:
+                entry[0], entry[1] = path, 0
+            else:
+                entry[1] += 1
+            self._paths.move_to_end(host)
+            while len(self._paths) > self.max_size:
+                self._paths.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._paths.clear()
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+domain_paths = DomainPathCache()
+
+
+def _host(url: str) -> str:
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def _stripped_length(texts: list[str]) -> int:
+    return sum(len(t.strip()) for t in texts)
+
+
+def _text_length(el: lxml_html.HtmlElement) -> int:
+    """Visible characters under ``el`` (script/style/... text excluded)."""
+    return _stripped_length(_ALL_TEXT(el)) - _stripped_length(_INVISIBLE_TEXT(el))
+
+
+def _single_article_element(tree: lxml_html.HtmlElement) -> Optional[lxml_html.HtmlElement]:
+    """Return the page's only ``<article>`` (or else only ``<main>``), if any."""
+    for tag in ("article", "main"):
+        elements = tree.xpath(f"//{tag}")
+        if len(elements) == 1:
+            return elements[0]
+        if elements:
+            return None
+    return None
+
+
+def _iter_json_ld_nodes(data: object):
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld_nodes(data["@graph"])
+
+
+def _json_ld_article_body(tree: lxml_html.HtmlElement) -> Optional[str]:
+    """Return the longest JSON-LD ``articleBody`` on the page, if any."""
+    best: Optional[str] = None
+    for script in _JSON_LD_SCRIPTS(tree):
+        if not script.text:
+            continue
+        try:
+            data = json.loads(script.text)
+        except ValueError:
+            continue
+        for node in _iter_json_ld_nodes(data):
+            body = node.get("articleBody")
+            if isinstance(body, list):
+                body = "\n\n".join(b for b in body if isinstance(b, str))
+            if isinstance(body, str) and (best is None or len(body) > len(best)):
+                best = body
+    return best
+
+
+def _body_to_html(body: str) -> str:
+    """Turn an ``articleBody`` (plain text, sometimes HTML) into HTML."""
+    if "</p>" in body or "<br" in body:
+        return body
+    paragraphs = [p.strip() for p in body.splitlines() if p.strip()]
+    return "".join(f"<p>{escape(p, quote=False)}</p>" for p in paragraphs)
+
+
+def _json_ld_candidate(tree: lxml_html.HtmlElement) -> Optional[tuple[str, int]]:
+    """Return ``(html, text_length)`` of a long enough JSON-LD ``articleBody``."""
+    body = _json_ld_article_body(tree)
+    if not body:
+        return None
+    html = _body_to_html(body)
+    length = _text_length(lxml_html.fragment_fromstring(html, create_parent="div"))
+    if length < MIN_ARTICLE_CHARS:
+        return None
+    return html, length
+
+
+def _article_candidate(
+    tree: lxml_html.HtmlElement,
+) -> Optional[tuple[lxml_html.HtmlElement, int]]:
+    """Return ``(element, text_length)`` of a single dominant ``<article>``/``<main>``."""
+    element = _single_article_element(tree)
+    if element is None:
+        return None
+
+    article_length = _text_length(element)
+    if article_length < MIN_ARTICLE_CHARS:
+        return None
+
+    body = tree.body
+    page_length = _text_length(body if body is not None else tree)
+    if article_length < MIN_TEXT_SHARE * page_length:
+        return None
+    if _stripped_length(_LINK_TEXT(element)) > MAX_LINK_DENSITY * article_length:
+        return None
+
+    return element, article_length
+
+
+def _json_ld_trusted(tree: lxml_html.HtmlElement, length: int) -> bool:
+    # A much shorter body than the on-page article is a teaser, not the article
+    element = _single_article_element(tree)
+    return element is None or length >= MIN_JSON_LD_COVERAGE * _text_length(element)
+
+
+def probe_json_ld(tree: lxml_html.HtmlElement) -> Optional[str]:
+    """Return article HTML from JSON-LD ``articleBody`` when it is trustworthy."""
+    candidate = _json_ld_candidate(tree)
+    if candidate is None or not _json_ld_trusted(tree, candidate[1]):
+        return None
+    return candidate[0]
+
+
+def probe_article(tree: lxml_html.HtmlElement) -> Optional[str]:
+    """Return the HTML of a single dominant ``<article>``/``<main>`` element."""
+    candidate = _article_candidate(tree)
+    if candidate is None:
+        return None
+    return lxml_html.tostring(candidate[0], encoding="unicode", with_tail=False)
+
+
+_PROBES = {"json_ld": probe_json_ld, "article": probe_article}
+
+
+def find_main_content(
+    tree: lxml_html.HtmlElement,
+    url: str,
+    *,
+    cache: DomainPathCache = domain_paths,
+) -> Optional[tuple[ExtractionPath, str]]:
+    """
+    Try the structured-data probes and return ``(path, html)`` on success.
+
+    The probe that last succeeded for the URL's host runs first, and the
+    other is skipped when it passes. Otherwise a trusted ``<article>``/``<main>``
+    is preferred, since it keeps headings, lists and links; JSON-LD
+    ``articleBody`` (plain text) is used when there is no such element or
+    the element is only a teaser of the body. Hosts that missed
+    ``PROBE_MISS_LIMIT`` times in a row return ``None`` without probing,
+    except for every ``REPROBE_INTERVAL``-th page. Call :func:`record_path`
+    with the path used when this returns ``None``.
+    """
+    host = _host(url)
+    if host and not cache.should_probe(host):
+        return None
+
+    found: Optional[tuple[ExtractionPath, str]] = None
+    preferred = cache.get(host) if host else None
+    if preferred is not None:
+        html = _PROBES[preferred](tree)
+        if html:
+            found = preferred, html  # type: ignore[assignment]
+
+    if found is None:
+        article = _article_candidate(tree)
+        json_ld = _json_ld_candidate(tree)
+        if article is not None and (
+            json_ld is None or article[1] >= MIN_ARTICLE_COVERAGE * json_ld[1]
+        ):
+            found = "article", lxml_html.tostring(article[0], encoding="unicode", with_tail=False)
+        elif json_ld is not None and _json_ld_trusted(tree, json_ld[1]):
+            found = "json_ld", json_ld[0]
+
+    if found:
+        cache.record(host, found[0])
+    return found
+
+
+def record_path(url: str, path: ExtractionPath, *, cache: DomainPathCache = domain_paths) -> None:
+    """Remember which extraction path was used for the URL's host."""
+    cache.record(_host(url), path)
@@ -20,33 +20,23 @@ class FetchResult:
     final_url: str
     status_code: int
     content_type: str
+    truncated: bool = False
 
 
-def fetch_page(
-    url: str,
-    *,
-    timeout: int = 15000,
-    headers: dict[str, str] | None = None,
-) -> FetchResult:
-    """Fetch a web page with smart defaults."""
-    user_agent = random.choice(USER_AGENTS)
-
+def _request_headers(headers: dict[str, str] | None) -> dict[str, str]:
+    """Browser-like default headers with a rotated user agent."""
     default_headers = {
-        "User-Agent": user_agent,
+        "User-Agent": random.choice(USER_AGENTS),
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
     }
     if headers:
         default_headers.update(headers)
+    return default_headers
 
-    timeout_seconds = timeout / 1000
 
-    response = httpx.get(
-        url,
-        headers=default_headers,
-        follow_redirects=True,
-        timeout=timeout_seconds,
-    )
+def _check_response(response: httpx.Response) -> str:
+    """Raise for HTTP errors and non-HTML responses; return the content type."""
     response.raise_for_status()
 
     content_type = response.headers.get("content-type", "")
@@ -54,10 +44,85 @@ def fetch_page(
         raise ValueError(
             f"Unsupported content type: {content_type}. Only HTML pages are supported."
         )
+    return content_type
+
+
+def _append_limited(body: bytearray, chunk: bytes, max_bytes: int) -> bool:
+    """Append ``chunk`` to ``body``; return True once ``max_bytes`` is exceeded."""
+    body += chunk
+    if len(body) > max_bytes:
+        del body[max_bytes:]
+        return True
+    return False
 
+
+def _result(response: httpx.Response, html: str, content_type: str, truncated: bool) -> FetchResult:
     return FetchResult(
-        html=response.text,
+        html=html,
         final_url=str(response.url),
         status_code=response.status_code,
         content_type=content_type,
+        truncated=truncated,
     )
+
+
+def fetch_page(
+    url: str,
+    *,
+    timeout: int = 15000,
+    headers: dict[str, str] | None = None,
+    max_bytes: int | None = None,
+) -> FetchResult:
+    """
+    Fetch a web page with smart defaults.
+
+    With ``max_bytes`` set, the body is streamed and reading stops once the
+    limit is reached, so oversized pages never sit in memory in full.
+    """
+    with httpx.stream(
+        "GET",
+        url,
+        headers=_request_headers(headers),
+        follow_redirects=True,
+        timeout=timeout / 1000,
+    ) as response:
+        content_type = _check_response(response)
+
+        if max_bytes is None:
+            response.read()
+            return _result(response, response.text, content_type, truncated=False)
+
+        body = bytearray()
+        truncated = False
+        for chunk in response.iter_bytes():
+            if _append_limited(body, chunk, max_bytes):
+                truncated = True
+                break
+        html = body.decode(response.encoding or "utf-8", errors="replace")
+        return _result(response, html, content_type, truncated)
+
+
+async def fetch_page_async(
+    url: str,
+    *,
+    timeout: int = 15000,
+    headers: dict[str, str] | None = None,
+    max_bytes: int | None = None,
+) -> FetchResult:
+    """Async variant of :func:`fetch_page`."""
+    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout / 1000) as client:
+        async with client.stream("GET", url, headers=_request_headers(headers)) as response:
+            content_type = _check_response(response)
+
+            if max_bytes is None:
+                await response.aread()
+                return _result(response, response.text, content_type, truncated=False)
+
+            body = bytearray()
+            truncated = False
+            async for chunk in response.aiter_bytes():
+                if _append_limited(body, chunk, max_bytes):
+                    truncated = True
+                    break
+            html = body.decode(response.encoding or "utf-8", errors="replace")
+            return _result(response, html, content_type, truncated)
@@ -0,0 +1,149 @@
+"""Link normalization — resolve, canonicalize and dedupe page links."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from urllib.parse import SplitResult, unquote_plus, urljoin, urlsplit, urlunsplit
+
+# Query parameters that only track the click, never change the page.
+# Entries ending in "*" match any parameter with that prefix.
+DEFAULT_TRACKING_PARAMS = frozenset({
+    "utm_*",
+    "fbclid", "gclid", "gclsrc", "gbraid", "wbraid", "dclid", "msclkid", "yclid",
+    "twclid", "ttclid", "li_fat_id", "igshid",
+    "mc_cid", "mc_eid",
+    "_ga", "_gl",
+    "_hsenc", "_hsmi", "__hssc", "__hstc", "__hsfp", "hsctatracking",
+    "mkt_tok", "vero_id", "vero_conv", "oly_anon_id", "oly_enc_id", "rb_clickid",
+    "s_cid", "wickedid", "ref_src",
+})
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class LinkNormalizer:
+    """
+    Resolve hrefs against a base URL and reduce them to one canonical form.
+
+    Canonical URLs have a lowercase scheme and host, no default port, no
+    fragment, no trailing slash (except the root path), and a sorted query
+    string with tracking parameters removed. Non-HTTP links and same-page
+    anchors normalize to ``None``. The base URL is parsed once and results
+    are cached per raw href, so pages with thousands of (often repeated)
+    anchors stay cheap.
+
+    Usage:
+        normalize = LinkNormalizer("https://example.com/blog/")
+        normalize("/post?utm_source=x&b=2&a=1")  # "https://example.com/post?a=1&b=2"
+        normalize("mailto:me@example.com")       # None
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        tracking_params: Iterable[str] | None = None,
+        strip_trailing_slash: bool = True,
+    ) -> None:
+        self.base_url = base_url
+        self.strip_trailing_slash = strip_trailing_slash
+
+        params = DEFAULT_TRACKING_PARAMS if tracking_params is None else tracking_params
+        self._strip_exact = frozenset(p.lower() for p in params if not p.endswith("*"))
+        self._strip_prefixes = tuple(p[:-1].lower() for p in params if p.endswith("*"))
+
+        try:
+            base = urlsplit(base_url)
+        except ValueError:
+            base = urlsplit("")
+        self._base_scheme = base.scheme.lower()
+        self._base_origin = f"{base.scheme}://{base.netloc}"
+        self._base_path = base.path or "/"
+        self._base_is_http = self._base_scheme in ("http", "https") and bool(base.netloc)
+
+        self._cache: dict[str, str | None] = {}
+        self._base_canonical: str | None = None
+        self._base_canonical = self._normalize(base_url)
+
+    def __call__(self, href: str) -> str | None:
+        try:
+            return self._cache[href]
+        except KeyError:
+            pass
+        canonical = self._normalize(href)
+        self._cache[href] = canonical
+        return canonical
+
+    def _resolve(self, href: str) -> str:
+        """Resolve ``href`` to an absolute URL, avoiding ``urljoin`` for common shapes."""
+        if href[:8].lower().startswith(("http://", "https://")):
+            return href
+        if self._base_is_http and "/." not in href and "\\" not in href:
+            if href.startswith("//"):
+                return f"{self._base_scheme}:{href}"
+            if href.startswith("/"):
+                return self._base_origin + href
+            if href.startswith("?"):
+                return self._base_origin + self._base_path + href
+        return urljoin(self.base_url, href)
+
+    def _netloc(self, parts: SplitResult, scheme: str) -> str | None:
+        host = (parts.hostname or "").rstrip(".")
+        if not host:
+            return None
+        if ":" in host:
+            host = f"[{host}]"  # IPv6 literal
+        port = parts.port
+        netloc = host if port is None or port == DEFAULT_PORTS[scheme] else f"{host}:{port}"
+        if parts.username is not None:
+            userinfo = parts.username
+            if parts.password is not None:
+                userinfo += f":{parts.password}"
+            netloc = f"{userinfo}@{netloc}"
+        return netloc
+
+    def _path(self, path: str) -> str:
+        if not path:
+            return "/"
+        if self.strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+            return path.rstrip("/") or "/"
+        return path
+
+    def _query(self, query: str) -> str:
+        """Drop tracking parameters and sort the rest, without re-encoding."""
+        pieces = []
+        for piece in query.split("&"):
+            if not piece:
+                continue
+            name = unquote_plus(piece.partition("=")[0]).lower()
+            if name in self._strip_exact or name.startswith(self._strip_prefixes):
+                continue
+            pieces.append(piece)
+        pieces.sort()
+        return "&".join(pieces)
+
+    def _normalize(self, href: str) -> str | None:
+        href = href.strip()
+        # Empty hrefs and same-page anchors
+        if not href or href.startswith("#"):
+            return None
+
+        try:
+            parts = urlsplit(self._resolve(href))
+            scheme = parts.scheme.lower()
+            if scheme not in DEFAULT_PORTS:
+                return None
+            netloc = self._netloc(parts, scheme)
+        except ValueError:
+            return None
+        if netloc is None:
+            return None
+
+        canonical = urlunsplit(
+            (scheme, netloc, self._path(parts.path), self._query(parts.query) if parts.query else "", "")
+        )
+
+        # A fragment pointing back at the base page is a same-page anchor
+        if parts.fragment and canonical == self._base_canonical:
+            return None
+        return canonical
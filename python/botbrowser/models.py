@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict, Literal, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from pydantic import AliasChoices, BaseModel, Field
+
+# How the main content was found: structured data (JSON-LD articleBody or a
+# single <article>/<main>), trafilatura, or the whole page as a last resort
+ExtractionPath = Literal["json_ld", "article", "trafilatura", "full_page"]
 
 
 class ExtractOptions(BaseModel):
@@ -14,6 +18,11 @@ class ExtractOptions(BaseModel):
     timeout: int = 15000
     include_links: bool = True
     headers: Optional[Dict[str, str]] = None
+    low_memory: bool = False
+    max_html_size: Optional[int] = None
+    trace_memory: bool = False
+    fast_path: bool = True
+    tracking_params: Optional[List[str]] = None
 
 
 class ExtractedLink(BaseModel):
@@ -23,14 +32,39 @@ class ExtractedLink(BaseModel):
     href: str
 
 
+class ExtractedSection(BaseModel):
+    """A heading-delimited section of page content, as yielded by iter_extract."""
+
+    index: int
+    heading: str
+    heading_path: list[str]
+    level: int
+    content: str
+    token_estimate: int
+
+
 class ExtractionMetadata(BaseModel):
     """Metadata about the extraction including token savings."""
 
-    raw_token_estimate: int
-    clean_token_estimate: int
-    token_savings_percent: int
-    word_count: int
-    fetched_at: str
+    # Validation also accepts the camelCase keys used by the REST API server
+    raw_token_estimate: int = Field(
+        validation_alias=AliasChoices("raw_token_estimate", "rawTokenEstimate")
+    )
+    clean_token_estimate: int = Field(
+        validation_alias=AliasChoices("clean_token_estimate", "cleanTokenEstimate")
+    )
+    token_savings_percent: int = Field(
+        validation_alias=AliasChoices("token_savings_percent", "tokenSavingsPercent")
+    )
+    word_count: int = Field(validation_alias=AliasChoices("word_count", "wordCount"))
+    fetched_at: str = Field(validation_alias=AliasChoices("fetched_at", "fetchedAt"))
+    truncated: bool = False
+    peak_memory_bytes: Optional[int] = Field(
+        default=None, validation_alias=AliasChoices("peak_memory_bytes", "peakMemoryBytes")
+    )
+    extraction_path: Optional[ExtractionPath] = Field(
+        default=None, validation_alias=AliasChoices("extraction_path", "extractionPath")
+    )
 
 
 class BotBrowserResult(BaseModel):
@@ -40,6 +74,19 @@ class BotBrowserResult(BaseModel):
     title: str
     description: str
     content: str
-    text_content: str
+    text_content: str = Field(validation_alias=AliasChoices("text_content", "textContent"))
     links: list[ExtractedLink]
     metadata: ExtractionMetadata
+
+    def to_bytes(self) -> bytes:
+        """Encode as a compact binary record (see ``botbrowser.serialization``)."""
+        from botbrowser.serialization import to_bytes
+
+        return to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> BotBrowserResult:
+        """Decode a record produced by :meth:`to_bytes`, without copying ``data``."""
+        from botbrowser.serialization import from_bytes
+
+        return from_bytes(data)
@@ -0,0 +1,338 @@
+"""Compact serialization for BotBrowserResult — binary records, fast JSON and result files.
+
+Binary record layout (little-endian)::
+
+    b"BBR" | u8 version | u32 link count | u32 string lengths... | UTF-8 strings
+
+The strings are ``url, title, description, content, text_content, metadata``
+(metadata as JSON) followed by ``text, href`` for each link. Field names are
+never stored, and any single field can be read straight out of the buffer
+without decoding the rest.
+
+A result file is a short header followed by ``u32 length | record`` frames.
+It takes a single writer at a time and is append-only: the file never
+shrinks, so other processes can memory-map and iterate it lazily while it
+is being written. A partial frame left by a crashed writer is sealed into a
+zero-filled padding frame (which readers skip) rather than truncated.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from itertools import accumulate
+from typing import Any, BinaryIO, Union
+
+from pydantic import BaseModel
+
+from botbrowser.models import BotBrowserResult, ExtractionMetadata
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+RECORD_MAGIC = b"BBR"
+RECORD_VERSION = 1
+FILE_MAGIC = b"BBRF\x01\x00\x00\x00"
+
+_HEADER = struct.Struct("<3sBI")
+_FRAME = struct.Struct("<I")
+_FIELDS = ("url", "title", "description", "content", "text_content")
+# Strings stored before the links: the fields above plus the metadata JSON
+_FIXED_STRINGS = len(_FIELDS) + 1
+
+
+# --- JSON ---
+
+def dumps_json(obj: BaseModel | dict[str, Any] | list[Any]) -> bytes:
+    """
+    Serialize a model or plain JSON data to compact JSON bytes.
+
+    Models use pydantic's native serializer (faster than dumping to a dict
+    first); plain data goes through orjson when it is installed.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json().encode()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads_json(data: Buffer | str) -> Any:
+    """Parse JSON, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+# --- Binary records ---
+
+def to_bytes(result: BotBrowserResult) -> bytes:
+    """Encode a result as a compact, length-prefixed binary record."""
+    strings = [getattr(result, field).encode() for field in _FIELDS]
+    strings.append(dumps_json(result.metadata.model_dump(exclude_none=True)))
+    for link in result.links:
+        strings.append(link.text.encode())
+        strings.append(link.href.encode())
+
+    lengths = struct.pack(f"<{len(strings)}I", *map(len, strings))
+    return b"".join(
+        (_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, len(result.links)), lengths, *strings)
+    )
+
+
+def _layout(data: Buffer) -> tuple[int, tuple[int, ...], int]:
+    """Return ``(link_count, string_lengths, blob_offset)`` for a record."""
+    try:
+        magic, version, link_count = _HEADER.unpack_from(data, 0)
+        if magic != RECORD_MAGIC:
+            raise ValueError("Not a BotBrowser record")
+        if version != RECORD_VERSION:
+            raise ValueError(f"Unsupported record version: {version}")
+        count = _FIXED_STRINGS + 2 * link_count
+        lengths = struct.unpack_from(f"<{count}I", data, _HEADER.size)
+    except struct.error as exc:
+        raise ValueError(f"Truncated BotBrowser record: {exc}") from None
+
+    blob_offset = _HEADER.size + 4 * count
+    if blob_offset + sum(lengths) > len(data):
+        raise ValueError("Truncated BotBrowser record")
+    return link_count, lengths, blob_offset
+
+
+def _decode_strings(data: Buffer, lengths: tuple[int, ...], offset: int) -> list[str]:
+    view = memoryview(data)
+    ends = list(accumulate(lengths, initial=offset))
+    strings = [str(view[ends[i]:ends[i + 1]], "utf-8") for i in range(_FIXED_STRINGS)]
+
+    # Links are almost always ASCII: decode them in one call and slice by byte
+    # offsets, which equal character offsets when nothing is multi-byte
+    start, end = ends[_FIXED_STRINGS], ends[-1]
+    links_blob = str(view[start:end], "utf-8")
+    if len(links_blob) == end - start:
+        bounds = ends[_FIXED_STRINGS:]
+        strings += [links_blob[a - start:b - start] for a, b in zip(bounds, bounds[1:])]
+    else:
+        strings += [
+            str(view[ends[i]:ends[i + 1]], "utf-8") for i in range(_FIXED_STRINGS, len(lengths))
+        ]
+    return strings
+
+
+def from_bytes(data: Buffer) -> BotBrowserResult:
+    """
+    Decode a record produced by :func:`to_bytes`.
+
+    Accepts ``bytes`` or any buffer (``memoryview`` slices of an ``mmap``
+    included) without copying it.
+    """
+    _, lengths, offset = _layout(data)
+    strings = _decode_strings(data, lengths, offset)
+
+    fields: dict[str, Any] = dict(zip(_FIELDS, strings))
+    fields["metadata"] = loads_json(strings[len(_FIELDS)])
+    link_strings = strings[_FIXED_STRINGS:]
+    fields["links"] = [
+        {"text": text, "href": href}
+        for text, href in zip(link_strings[0::2], link_strings[1::2])
+    ]
+    return BotBrowserResult.model_validate(fields)
+
+
+class ResultRecord:
+    """
+    A lazily decoded record in a result file.
+
+    ``raw`` is a zero-copy view into the file; individual fields (``url``,
+    ``title``, ...) decode only their own bytes, and :meth:`decode` builds
+    the full result. Views are only valid while the reader is open.
+    """
+
+    __slots__ = ("offset", "raw", "_layout")
+
+    def __init__(self, offset: int, raw: memoryview) -> None:
+        self.offset = offset
+        self.raw = raw
+        self._layout: tuple[int, tuple[int, ...], int] | None = None
+
+    def _field(self, index: int) -> str:
+        if self._layout is None:
+            self._layout = _layout(self.raw)
+        _, lengths, offset = self._layout
+        start = offset + sum(lengths[:index])
+        return str(self.raw[start:start + lengths[index]], "utf-8")
+
+    @property
+    def url(self) -> str:
+        return self._field(0)
+
+    @property
+    def title(self) -> str:
+        return self._field(1)
+
+    @property
+    def metadata(self) -> ExtractionMetadata:
+        return ExtractionMetadata.model_validate(loads_json(self._field(len(_FIELDS))))
+
+    def decode(self) -> BotBrowserResult:
+        return from_bytes(self.raw)
+
+    def __repr__(self) -> str:
+        return f"ResultRecord(offset={self.offset}, size={len(self.raw)})"
+
+
+# --- Result files ---
+
+def _seal_tail(path: str, start: int, end: int) -> None:
+    """
+    Turn the partial frame in ``[start, end)`` into a padding frame.
+
+    Truncating instead would pull pages out from under readers that have the
+    file mapped (SIGBUS). The payload is zeroed before the new length is
+    written, so a concurrent reader sees either a partial frame or padding.
+    """
+    padding = max(end - start - _FRAME.size, 0)
+    with open(path, "r+b") as f:
+        f.seek(start + _FRAME.size)
+        f.write(bytes(padding))
+        f.flush()
+        f.seek(start)
+        f.write(_FRAME.pack(padding))
+
+
+class ResultWriter:
+    """
+    Append results to a binary result file (one writer at a time).
+
+    Usage:
+        with ResultWriter("results.bbr") as writer:
+            writer.append(result)
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._file: BinaryIO = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(FILE_MAGIC)
+            return
+
+        try:
+            with ResultReader(self.path) as reader:
+                end = reader.valid_length
+            size = self._file.tell()
+            if end < size:
+                # A crashed writer left a partial last frame; seal it so new
+                # records stay aligned
+                _seal_tail(self.path, end, size)
+                self._file.seek(0, os.SEEK_END)
+        except ValueError:
+            self._file.close()
+            raise
+
+    def append(self, result: BotBrowserResult) -> int:
+        """Append one result; returns the record's offset in the file."""
+        record = to_bytes(result)
+        offset = self._file.tell() + _FRAME.size
+        # One write per frame so a crash can only leave a short tail
+        self._file.write(_FRAME.pack(len(record)) + record)
+        return offset
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> ResultWriter:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class ResultReader:
+    """
+    Memory-map a result file and iterate its records lazily.
+
+    Iterating yields :class:`ResultRecord` views without decoding anything;
+    :meth:`results` decodes them one at a time. Only records present when
+    the reader was opened are seen; a partially written last record and
+    padding frames are skipped.
+
+    Usage:
+        with ResultReader("results.bbr") as reader:
+            urls = [record.url for record in reader]
+            for result in reader.results():
+                print(result.title)
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                raise ValueError(f"Not a BotBrowser result file: {self.path}")
+            size = os.fstat(f.fileno()).st_size
+            self._mmap: mmap.mmap | None = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if size > len(FILE_MAGIC)
+                else None
+            )
+
+    def _frames(self) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, end)`` of each complete record."""
+        if self._mmap is None:
+            return
+        end = len(self._mmap)
+        offset = len(FILE_MAGIC)
+        while offset + _FRAME.size <= end:
+            (length,) = _FRAME.unpack_from(self._mmap, offset)
+            start = offset + _FRAME.size
+            if start + length > end:
+                return
+            yield start, start + length
+            offset = start + length
+
+    @property
+    def valid_length(self) -> int:
+        """File size up to the end of the last complete record."""
+        last = len(FILE_MAGIC)
+        for _, last in self._frames():
+            pass
+        return last
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        if self._mmap is None:
+            return
+        view = memoryview(self._mmap)
+        for start, end in self._frames():
+            if self._mmap[start:start + len(RECORD_MAGIC)] != RECORD_MAGIC:
+                continue  # Padding over a crashed writer's partial frame
+            yield ResultRecord(start, view[start:end])
+
+    def results(self) -> Iterator[BotBrowserResult]:
+        """Decode and yield each result in file order."""
+        for record in self:
+            yield record.decode()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Record views are still alive; the map closes once they are released
+                pass
+            self._mmap = None
+
+    def __enter__(self) -> ResultReader:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
@@ -0,0 +1,195 @@
+"""Streaming extraction — yields heading-delimited sections as they are converted."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Iterator
+
+from lxml import etree
+from lxml import html as lxml_html
+from trafilatura.utils import load_html
+
+from botbrowser.cleaner import clean_html
+from botbrowser.converter import html_to_markdown, iter_heading_blocks, markdown_to_text
+from botbrowser.core import _content_root, _estimate_tokens, _main_content, _normalize_options
+from botbrowser.fetcher import fetch_page, fetch_page_async
+from botbrowser.models import ExtractedSection, ExtractOptions
+
+
+def _iter_sections(blocks: Iterable[tuple[int, str]], format: str) -> Iterator[ExtractedSection]:
+    """
+    Group ``(heading_level, html)`` blocks into sections that start at each heading.
+
+    Blocks are cleaned and converted lazily, one at a time, so a consumer that
+    stops early never pays for the rest of the page. Consecutive headings with
+    no body between them (e.g. an ``h1`` directly followed by an ``h2``) are
+    kept together in one section.
+    """
+    stack: list[tuple[int, str]] = []
+    parts: list[str] = []
+    has_body = False
+    index = 0
+
+    def section() -> ExtractedSection:
+        markdown = "\n\n".join(parts)
+        content = markdown if format == "markdown" else markdown_to_text(markdown)
+        return ExtractedSection(
+            index=index,
+            heading=stack[-1][1] if stack else "",
+            heading_path=[text for _, text in stack],
+            level=stack[-1][0] if stack else 0,
+            content=content,
+            token_estimate=_estimate_tokens(content),
+        )
+
+    for level, block in blocks:
+        markdown = html_to_markdown(clean_html(block))
+        if not markdown:
+            continue
+
+        if level:
+            if has_body:
+                yield section()
+                index += 1
+                parts, has_body = [], False
+
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, markdown_to_text(markdown)))
+        else:
+            has_body = True
+        parts.append(markdown)
+
+    if parts:
+        yield section()
+
+
+def iter_extract_from_html(
+    html: str,
+    url: str = "",
+    *,
+    format: str = "markdown",
+    fast_path: bool = True,
+) -> Iterator[ExtractedSection]:
+    """
+    Yield heading-delimited sections of already-fetched HTML as they are converted.
+
+    Usage:
+        for section in iter_extract_from_html(html, "https://example.com/article"):
+            print(section.heading_path, section.token_estimate)
+    """
+    if not html.strip():
+        return
+
+    tree = load_html(html)
+    path, main_content_html = _main_content(
+        tree if tree is not None else html, url, fast_path=fast_path
+    )
+
+    if main_content_html:
+        del tree
+        root = _content_root(path, main_content_html)
+        del main_content_html
+    elif tree is not None:
+        # Fallback: the full page body
+        root = tree.body if tree.body is not None else tree
+        del tree
+    else:
+        try:
+            root = lxml_html.document_fromstring(html)
+        except etree.ParserError:
+            return
+
+    yield from _iter_sections(iter_heading_blocks(root), format)
+
+
+def iter_extract(
+    url_or_options: str | ExtractOptions | None = None,
+    *,
+    url: str | None = None,
+    format: str = "markdown",
+    timeout: int = 15000,
+    headers: dict[str, str] | None = None,
+    fast_path: bool = True,
+) -> Iterator[ExtractedSection]:
+    """
+    Fetch a web page and yield its content section by section.
+
+    Each section starts at a heading and carries its heading path and token
+    estimate. Sections are converted on demand: stop iterating (or ``break``)
+    and the rest of the page is never cleaned or converted.
+
+    Usage:
+        for section in iter_extract("https://example.com/article"):
+            print(section.heading_path, section.content)
+            if enough(section):
+                break
+    """
+    opts = _normalize_options(
+        url_or_options,
+        url=url,
+        format=format,
+        timeout=timeout,
+        headers=headers,
+        fast_path=fast_path,
+    )
+    fetched = fetch_page(
+        opts.url, timeout=opts.timeout, headers=opts.headers, max_bytes=opts.max_html_size
+    )
+    yield from iter_extract_from_html(
+        fetched.html, fetched.final_url, format=opts.format, fast_path=opts.fast_path
+    )
+
+
+async def aiter_extract(
+    url_or_options: str | ExtractOptions | None = None,
+    *,
+    url: str | None = None,
+    format: str = "markdown",
+    timeout: int = 15000,
+    headers: dict[str, str] | None = None,
+    fast_path: bool = True,
+) -> AsyncIterator[ExtractedSection]:
+    """
+    Async variant of :func:`iter_extract`.
+
+    The page is fetched asynchronously and each section is converted in a
+    worker thread, so the event loop stays responsive between sections.
+
+    Usage:
+        async for section in aiter_extract("https://example.com/article"):
+            print(section.heading_path, section.content)
+    """
+    opts = _normalize_options(
+        url_or_options,
+        url=url,
+        format=format,
+        timeout=timeout,
+        headers=headers,
+        fast_path=fast_path,
+    )
+    fetched = await fetch_page_async(
+        opts.url, timeout=opts.timeout, headers=opts.headers, max_bytes=opts.max_html_size
+    )
+    sections = iter_extract_from_html(
+        fetched.html, fetched.final_url, format=opts.format, fast_path=opts.fast_path
+    )
+    del fetched
+
+    # The generator cannot be closed while a worker thread is inside it, so a
+    # cancelled consumer waits for the in-flight step before closing.
+    step: asyncio.Future[ExtractedSection | None] | None = None
+    try:
+        while True:
+            step = asyncio.ensure_future(asyncio.to_thread(next, sections, None))
+            section = await asyncio.shield(step)
+            step = None
+            if section is None:
+                break
+            yield section
+    finally:
+        if step is not None:
+            await asyncio.wait([step])
+            if not step.cancelled():
+                step.exception()
+        sections.close()
@@ -0,0 +1,176 @@
+"""Tests for the botbrowser command-line interface."""
+
+import io
+import json
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+import botbrowser.cli as cli
+from botbrowser.cli import _iter_sources, build_parser, main, run
+
+
+PAGE_HTML = """
+<html>
+<head><title>{title}</title></head>
+<body>
+    <main>
+        <h1>{title}</h1>
+        <p>This is the main article body for {title}, long enough to be kept as content.</p>
+        <p>See <a href="https://example.com/next">the next page</a> for more.</p>
+    </main>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def pages(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"page{i}.html"
+        path.write_text(PAGE_HTML.format(title=f"Page {i}"), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def _records(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines()]
+
+
+def test_run_writes_one_json_line_per_source(pages):
+    out = io.StringIO()
+    failures = run(pages, out, workers=0)
+    records = _records(out.getvalue())
+    assert failures == 0
+    assert len(records) == 3
+    assert sorted(r["title"] for r in records) == ["Page 0", "Page 1", "Page 2"]
+    assert all("main article body" in r["content"] for r in records)
+
+
+def test_run_process_pool(pages):
+    out = io.StringIO()
+    failures = run(pages, out, workers=2, concurrency=2)
+    assert failures == 0
+    assert len(_records(out.getvalue())) == 3
+
+
+def test_run_process_pool_spawns_workers(pages, monkeypatch):
+    contexts = []
+    original = cli.ProcessPoolExecutor
+
+    def recording(*args, **kwargs):
+        contexts.append(kwargs.get("mp_context"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", recording)
+    run(pages[:1], io.StringIO(), workers=1)
+    assert [c.get_start_method() for c in contexts] == ["spawn"]
+
+
+def test_run_selects_fields(pages):
+    out = io.StringIO()
+    run(pages[:1], out, workers=0, fields=["url", "title"])
+    (record,) = _records(out.getvalue())
+    assert set(record) == {"url", "title"}
+    assert record["url"].startswith("file://")
+
+
+def test_run_without_links(pages):
+    out = io.StringIO()
+    run(pages[:1], out, workers=0, include_links=False)
+    (record,) = _records(out.getvalue())
+    assert record["links"] == []
+
+
+def test_run_low_memory_with_size_limit(pages):
+    out = io.StringIO()
+    failures = run(pages[:1], out, workers=0, low_memory=True, max_size=120)
+    (record,) = _records(out.getvalue())
+    assert failures == 0
+    assert record["metadata"]["truncated"] is True
+    assert record["metadata"]["peak_memory_bytes"] >= 0
+
+
+def test_max_size_counts_bytes_for_local_files(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text("<html><body><p>" + "é" * 100 + "</p></body></html>", encoding="utf-8")
+    html, _, truncated = cli._fetch(str(path), 15000, None, 50)
+    assert truncated is True
+    assert len(html.encode("utf-8")) <= 50 + 2  # a split character decodes to U+FFFD
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs SIGKILL")
+def test_run_survives_killed_worker(tmp_path, monkeypatch):
+    body = "".join(f"<h2>Part {i}</h2><p>{'Some article prose. ' * 20}</p>" for i in range(300))
+    sources = []
+    for i in range(40):
+        path = tmp_path / f"page{i}.html"
+        path.write_text(f"<html><body><main><h1>Page {i}</h1>{body}</main></body></html>")
+        sources.append(str(path))
+
+    pools = []
+    original = cli.ProcessPoolExecutor
+
+    def recording(*args, **kwargs):
+        pools.append(original(*args, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", recording)
+
+    def kill_a_worker():
+        # As the OOM killer would, once the first pool's workers are busy
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            # Only this run's workers, not leftovers from earlier tests
+            workers = list(pools[0]._processes.values()) if pools else []
+            if workers:
+                time.sleep(0.5)
+                os.kill(workers[0].pid, signal.SIGKILL)
+                return
+            time.sleep(0.05)
+
+    killer = threading.Thread(target=kill_a_worker)
+    killer.start()
+    out = io.StringIO()
+    failures = run(sources, out, workers=2, concurrency=4)
+    killer.join()
+
+    records = _records(out.getvalue())
+    assert len(pools) >= 2
+    assert 1 <= failures < len(sources)
+    # Every source still gets exactly one line
+    assert len(records) == len(sources)
+    assert sum("BrokenProcessPool" in r.get("error", "") for r in records) == failures
+
+
+def test_run_reports_errors_inline(pages, tmp_path):
+    out = io.StringIO()
+    missing = str(tmp_path / "missing.html")
+    failures = run([missing, pages[0]], out, workers=0)
+    records = _records(out.getvalue())
+    assert failures == 1
+    errors = [r for r in records if "error" in r]
+    assert errors == [{"url": missing, "error": errors[0]["error"]}]
+    assert "FileNotFoundError" in errors[0]["error"]
+
+
+def test_iter_sources_reads_stdin_when_no_args():
+    stdin = io.StringIO("https://a.example\n\n# comment\n  https://b.example  \n")
+    assert list(_iter_sources([], stdin)) == ["https://a.example", "https://b.example"]
+    assert list(_iter_sources(["-"], io.StringIO("x\n"))) == ["x"]
+    assert list(_iter_sources(["y"], io.StringIO("x\n"))) == ["y"]
+
+
+def test_parser_rejects_unknown_fields():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["--fields", "url,bogus"])
+
+
+def test_main_exit_code(pages, tmp_path, capsys):
+    assert main([*pages, "--workers", "0", "--fields", "title"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 3
+    assert main([str(tmp_path / "missing.html"), "--workers", "0"]) == 1
@@ -1,9 +1,30 @@
 """Tests for BotBrowser core extraction."""
 
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from lxml import html as lxml_html
+
 from botbrowser.cleaner import clean_html
-from botbrowser.converter import html_to_markdown, html_to_text
+from botbrowser.converter import (
+    html_to_markdown,
+    html_to_text,
+    iter_heading_blocks,
+    iter_html_blocks,
+    iter_html_chunks,
+)
 from botbrowser.models import BotBrowserResult, ExtractOptions, ExtractedLink, ExtractionMetadata
-from botbrowser.core import _extract_title, _extract_description, _extract_links, _estimate_tokens
+from botbrowser.core import (
+    _extract_title,
+    _extract_description,
+    _extract_links,
+    _estimate_tokens,
+    extract_from_html,
+)
+from botbrowser.fastpath import domain_paths
 
 
 SAMPLE_HTML = """
@@ -34,6 +55,13 @@ SAMPLE_HTML = """
 """
 
 
+@pytest.fixture(autouse=True)
+def _clear_domain_paths():
+    domain_paths.clear()
+    yield
+    domain_paths.clear()
+
+
 # --- Cleaner tests ---
 
 def test_clean_html_removes_scripts():
@@ -146,6 +174,59 @@ def test_html_to_text_strips_links():
     assert "https://example.com" not in text
 
 
+def test_iter_html_blocks_flattens_wrappers():
+    root = lxml_html.document_fromstring(
+        "<html><body><div><h1>Title</h1><section><p>One</p><p>Two</p></section></div></body></html>"
+    )
+    assert list(iter_html_blocks(root)) == ["<h1>Title</h1>", "<p>One</p>", "<p>Two</p>"]
+
+
+def test_iter_html_blocks_keeps_attributed_wrappers_and_groups_inline():
+    root = lxml_html.fragment_fromstring(
+        '<div>Lead <a href="/x">link</a> tail<div class="sidebar"><p>Side</p></div><p>Body</p></div>'
+    )
+    assert list(iter_html_blocks(root)) == [
+        'Lead <a href="/x">link</a> tail',
+        '<div class="sidebar"><p>Side</p></div>',
+        "<p>Body</p>",
+    ]
+
+
+def test_iter_html_blocks_flattens_attributed_wrappers():
+    root = lxml_html.document_fromstring(
+        '<html><body><article class="post" id="main"><h1>Title</h1>'
+        '<div class="content"><p>One</p><p>Two</p></div>'
+        '<div hidden><p>Hidden</p></div><section style="display: none"><p>Gone</p></section>'
+        "</article></body></html>"
+    )
+    assert list(iter_html_blocks(root)) == [
+        "<h1>Title</h1>",
+        "<p>One</p>",
+        "<p>Two</p>",
+        '<div hidden><p>Hidden</p></div>',
+        '<section style="display: none"><p>Gone</p></section>',
+    ]
+
+
+def test_iter_heading_blocks_splits_at_nested_headings():
+    root = lxml_html.fragment_fromstring(
+        '<div><ul class="cards"><li><h3>Card</h3><p>Body</p></li></ul>'
+        '<table><tr><td>Cell</td></tr></table><aside class="widget"><h2>Ad</h2></aside></div>'
+    )
+    assert list(iter_heading_blocks(root)) == [
+        (3, "<h3>Card</h3>"),
+        (0, "<p>Body</p>"),
+        (0, "<table><tr><td>Cell</td></tr></table>"),
+        (0, '<aside class="widget"><h2>Ad</h2></aside>'),
+    ]
+
+
+def test_iter_html_chunks_joins_blocks():
+    root = lxml_html.fragment_fromstring("<div>" + "<p>Paragraph</p>" * 10 + "</div>")
+    chunks = list(iter_html_chunks(root, 40))
+    assert chunks == ["<p>Paragraph</p>" * 3] * 3 + ["<p>Paragraph</p>"]
+
+
 # --- Extractor helper tests ---
 
 def test_extract_title():
@@ -211,6 +292,150 @@ def test_extract_links_skips_same_page_anchors():
     assert len(links) == 0
 
 
+def test_extract_links_text_skips_scripts_and_styles():
+    html = (
+        '<a href="/a">Docs<script>var x=1</script></a>'
+        '<a href="/b"><style>.x{}</style><span>API</span> <b>ref</b></a>'
+    )
+    links = _extract_links(html, "https://example.com")
+    assert [link.text for link in links] == ["Docs", "APIref"]
+
+
+def test_extract_links_dedupes_canonical_form():
+    html = """
+    <a href="https://example.com/a?utm_source=feed">Link A</a>
+    <a href="HTTPS://EXAMPLE.COM:443/a/">Link A again</a>
+    <a href="/a#section">Link A anchor</a>
+    <a href="/b?y=2&x=1">Link B</a>
+    """
+    links = _extract_links(html, "https://example.com/page")
+    assert [(link.text, link.href) for link in links] == [
+        ("Link A", "https://example.com/a"),
+        ("Link B", "https://example.com/b?x=1&y=2"),
+    ]
+
+
+def test_extract_links_custom_tracking_params():
+    html = '<a href="/a?ref=nav&utm_source=x">A</a>'
+    links = _extract_links(html, "https://example.com", ["ref"])
+    assert links[0].href == "https://example.com/a?utm_source=x"
+
+
+def test_extract_links_many_anchors():
+    html = "".join(f'<a href="/item/{i % 500}?utm_source=list">Item {i}</a>' for i in range(5000))
+    links = _extract_links(html, "https://example.com")
+    assert len(links) == 500
+    assert links[-1].href == "https://example.com/item/499"
+
+
+# --- Low-memory mode ---
+
+LARGE_SECTION = (
+    "<h2>Section {i}</h2>"
+    "<p>Paragraph {i} of a long synthetic article. It repeats ordinary prose so the "
+    "extractor treats it as the main content of the page.</p>"
+    "<ul><li>First point {i}</li><li>Second point {i}</li></ul>"
+    "<p>See <a href='/ref/{i}'>reference {i}</a>.</p>\n"
+)
+
+
+def _large_page(sections: int) -> str:
+    return (
+        "<html><head><title>Large</title>"
+        '<meta name="description" content="A large page">'
+        "<script>" + "var x = 1;" * 16000 + "</script></head>"
+        "<body><nav><a href='/'>Home</a></nav><article><h1>Large</h1>"
+        + "".join(LARGE_SECTION.format(i=i) for i in range(sections))
+        + "</article></body></html>"
+    )
+
+
+def test_low_memory_matches_standard_output():
+    html = _large_page(30)
+    standard = extract_from_html(html, "https://example.com/page")
+    low = extract_from_html(html, "https://example.com/page", low_memory=True)
+    assert low.title == standard.title == "Large"
+    assert low.description == standard.description == "A large page"
+    assert low.content == standard.content
+    assert low.text_content == standard.text_content
+    assert low.links == standard.links
+    assert low.metadata.extraction_path == standard.metadata.extraction_path == "article"
+    assert standard.metadata.peak_memory_bytes is None
+    # Peak RSS growth: 0 when this process already peaked higher
+    assert low.metadata.peak_memory_bytes >= 0
+
+
+def test_low_memory_matches_standard_with_attributed_wrappers():
+    html = _large_page(30).replace("<article>", "<article class='post'>")
+    low = extract_from_html(html, "https://example.com/page", low_memory=True)
+    assert low.content == extract_from_html(html, "https://example.com/page").content
+    assert low.metadata.extraction_path == "article"
+
+
+def test_low_memory_trace_memory():
+    html = _large_page(30)
+    result = extract_from_html(html, "https://example.com/page", low_memory=True, trace_memory=True)
+    assert 0 < result.metadata.peak_memory_bytes < 10 * len(html)
+
+
+_RSS_SCRIPT = textwrap.dedent("""
+    import sys
+    from botbrowser.core import extract_from_html
+    from tests.test_core import _large_page
+
+    def peak_rss():
+        # VmHWM starts fresh at exec, unlike ru_maxrss which inherits the parent's
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmHWM:"))
+
+    mode, wrapper = sys.argv[1:]
+    html = _large_page(600).replace("article>", wrapper + ">")
+    extract_from_html("<html><body><p>Warm up</p></body></html>", low_memory=True)
+    before = peak_rss()
+    result = extract_from_html(html, "https://example.com/page", low_memory=mode == "low")
+    assert "Paragraph 599" in result.content
+    print(peak_rss() - before, len(html))
+""")
+
+
+def _peak_rss_growth(mode: str, wrapper: str) -> tuple[int, int]:
+    """Return ``(peak RSS growth, page size)`` for one extraction in a fresh process."""
+    output = subprocess.run(
+        [sys.executable, "-c", _RSS_SCRIPT, mode, wrapper],
+        capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    ).stdout
+    growth, size = map(int, output.split())
+    return growth, size
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self/status")
+@pytest.mark.parametrize(
+    "wrapper, ceiling",
+    [
+        # <article> is taken directly by the fast path
+        ("article", 25),
+        # A plain <div> goes through trafilatura, whose tree copies dominate
+        ("div", 80),
+    ],
+)
+def test_low_memory_rss_ceiling(wrapper, ceiling):
+    # Fresh processes, so neither run is hidden under an earlier peak
+    standard, _ = _peak_rss_growth("standard", wrapper)
+    low, size = _peak_rss_growth("low", wrapper)
+    assert 0 < low < ceiling * size
+    assert low < 0.8 * standard
+
+
+def test_max_html_size_truncates():
+    html = "<html><body><p>" + "word " * 1000 + "</p></body></html>"
+    result = extract_from_html(html, max_html_size=100)
+    assert result.metadata.truncated is True
+    assert result.metadata.raw_token_estimate == 25
+    assert extract_from_html(html).metadata.truncated is False
+    assert extract_from_html(html, low_memory=True, max_html_size=100).metadata.truncated is True
+
+
 # --- Token estimation ---
 
 def test_estimate_tokens():
@@ -227,6 +452,8 @@ def test_extract_options_defaults():
     assert opts.timeout == 15000
     assert opts.include_links is True
     assert opts.headers is None
+    assert opts.low_memory is False
+    assert opts.max_html_size is None
 
 
 def test_botbrowser_result_construction():
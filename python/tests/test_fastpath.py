@@ -0,0 +1,200 @@
+"""Tests for the structured-data fast path."""
+
+import json
+
+import pytest
+
+import botbrowser.fastpath as fastpath
+from botbrowser.core import extract_from_html
+from botbrowser.fastpath import (
+    PROBE_MISS_LIMIT,
+    REPROBE_INTERVAL,
+    DomainPathCache,
+    domain_paths,
+    find_main_content,
+)
+from trafilatura.utils import load_html
+
+
+PARAGRAPH = (
+    "This is a sentence of ordinary article prose that goes on for a while so the "
+    "page has enough text to count as a real article. "
+)
+ARTICLE_BODY = "\n".join(PARAGRAPH * 2 for _ in range(4))
+
+
+@pytest.fixture(autouse=True)
+def _clear_domain_paths():
+    domain_paths.clear()
+    yield
+    domain_paths.clear()
+
+
+def _json_ld(data: object) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def _page(head: str = "", body: str = "") -> str:
+    return f"<html><head><title>Page</title>{head}</head><body>{body}</body></html>"
+
+
+def _scattered_body() -> str:
+    """Content spread over divs with no <article>/<main> to take directly."""
+    return "".join(f"<div><p>{PARAGRAPH * 3}</p></div>" for _ in range(6))
+
+
+def test_json_ld_article_body():
+    html = _page(
+        head=_json_ld({"@type": "NewsArticle", "headline": "H", "articleBody": ARTICLE_BODY}),
+        body="<div><p>Teaser only.</p></div>",
+    )
+    result = extract_from_html(html, "https://news.example/a")
+    assert result.metadata.extraction_path == "json_ld"
+    assert result.content.count("This is a sentence") == 8
+    assert "Teaser only" not in result.content
+
+
+def test_json_ld_in_graph():
+    html = _page(
+        head=_json_ld({"@context": "https://schema.org", "@graph": [
+            {"@type": "WebSite", "name": "Site"},
+            {"@type": "BlogPosting", "articleBody": ARTICLE_BODY},
+        ]}),
+    )
+    assert find_main_content(load_html(html), "https://blog.example/p")[0] == "json_ld"
+
+
+def test_short_json_ld_body_is_ignored():
+    html = _page(head=_json_ld({"@type": "Article", "articleBody": "Too short."}), body=_scattered_body())
+    result = extract_from_html(html, "https://news.example/a")
+    assert result.metadata.extraction_path == "trafilatura"
+
+
+def test_teaser_json_ld_loses_to_article_element():
+    teaser = PARAGRAPH * 5
+    html = _page(
+        head=_json_ld({"@type": "Article", "articleBody": teaser}),
+        body=f"<article><h1>Full</h1>{''.join(f'<p>{PARAGRAPH * 3}</p>' for _ in range(6))}</article>",
+    )
+    result = extract_from_html(html, "https://news.example/a")
+    assert result.metadata.extraction_path == "article"
+    assert "# Full" in result.content
+
+
+def test_single_main_element():
+    html = _page(body=f"<nav><a href='/'>Home</a></nav><main><h1>Title</h1><p>{PARAGRAPH * 6}</p></main>")
+    result = extract_from_html(html, "https://docs.example/page")
+    assert result.metadata.extraction_path == "article"
+    assert result.content.startswith("# Title")
+    assert "Home" not in result.content
+
+
+def test_multiple_articles_fall_back_to_trafilatura():
+    html = _page(body=f"<article><p>{PARAGRAPH * 4}</p></article><article><p>{PARAGRAPH * 4}</p></article>")
+    result = extract_from_html(html, "https://list.example/")
+    assert result.metadata.extraction_path == "trafilatura"
+
+
+def test_link_heavy_article_is_not_trusted():
+    links = "".join(f'<li><a href="/{i}">{PARAGRAPH}</a></li>' for i in range(6))
+    html = _page(body=f"<article><ul>{links}</ul></article>")
+    assert find_main_content(load_html(html), "https://links.example/") is None
+
+
+def test_article_preferred_over_json_ld():
+    body = "".join(f"<h2>Part {i}</h2><p>{PARAGRAPH * 2}</p>" for i in range(4))
+    html = _page(
+        head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY}),
+        body=f"<article class='post'><h1>Title</h1>{body}</article>",
+    )
+    result = extract_from_html(html, "https://news.example/a")
+    assert result.metadata.extraction_path == "article"
+    assert "## Part 3" in result.content
+
+
+def test_teaser_article_loses_to_json_ld():
+    html = _page(
+        head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY * 3}),
+        body=f"<article><h1>Teaser</h1><p>{PARAGRAPH * 5}</p></article>",
+    )
+    result = extract_from_html(html, "https://news.example/a")
+    assert result.metadata.extraction_path == "json_ld"
+    assert result.content.count("This is a sentence") == 24
+
+
+def test_domain_skips_probes_after_repeated_misses():
+    article = _page(head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY}))
+
+    # One index page without an article does not turn the fast path off
+    extract_from_html(_page(body=_scattered_body()), "https://site.example/")
+    assert domain_paths.get("site.example") is None
+    assert extract_from_html(article, "https://site.example/a").metadata.extraction_path == "json_ld"
+
+    for i in range(PROBE_MISS_LIMIT):
+        extract_from_html(_page(body=_scattered_body()), f"https://site.example/list/{i}")
+
+    # After several misses in a row the probes are skipped...
+    paths = [
+        extract_from_html(article, f"https://site.example/b/{i}").metadata.extraction_path
+        for i in range(REPROBE_INTERVAL)
+    ]
+    assert paths[:-1] == ["trafilatura"] * (REPROBE_INTERVAL - 1)
+    # ...apart from a periodic re-probe, whose hit re-enables them
+    assert paths[-1] == "json_ld"
+    assert extract_from_html(article, "https://site.example/c").metadata.extraction_path == "json_ld"
+
+    # Other hosts still probe
+    assert extract_from_html(article, "https://other.example/a").metadata.extraction_path == "json_ld"
+
+
+def test_full_page_fallback_counts_as_miss():
+    for i in range(PROBE_MISS_LIMIT):
+        result = extract_from_html("<html><body></body></html>", f"https://empty.example/{i}")
+        assert result.metadata.extraction_path == "full_page"
+    assert not domain_paths.should_probe("empty.example")
+
+
+def test_domain_tries_last_successful_probe_first(monkeypatch):
+    page = _page(body=f"<article><h1>Title</h1><p>{PARAGRAPH * 6}</p></article>")
+    assert extract_from_html(page, "https://blog.example/1").metadata.extraction_path == "article"
+    assert domain_paths.get("blog.example") == "article"
+
+    # The article probe passes again, so the JSON-LD probe never runs
+    json_ld_calls = []
+    original = fastpath._json_ld_article_body
+    monkeypatch.setattr(
+        fastpath, "_json_ld_article_body", lambda tree: json_ld_calls.append(1) or original(tree)
+    )
+    assert extract_from_html(page, "https://blog.example/2").metadata.extraction_path == "article"
+    assert json_ld_calls == []
+
+    # When it misses, both probes run as usual
+    json_ld_page = _page(head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY}))
+    assert extract_from_html(json_ld_page, "https://blog.example/3").metadata.extraction_path == "json_ld"
+    assert domain_paths.get("blog.example") == "json_ld"
+
+
+def test_fast_path_disabled():
+    html = _page(head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY}), body=_scattered_body())
+    result = extract_from_html(html, "https://news.example/a", fast_path=False)
+    assert result.metadata.extraction_path == "trafilatura"
+    assert len(domain_paths) == 0
+
+
+def test_low_memory_uses_fast_path():
+    html = _page(head=_json_ld({"@type": "Article", "articleBody": ARTICLE_BODY}))
+    result = extract_from_html(html, "https://news.example/a", low_memory=True)
+    assert result.metadata.extraction_path == "json_ld"
+    assert result.content.count("This is a sentence") == 8
+
+
+def test_domain_path_cache_is_bounded():
+    cache = DomainPathCache(max_size=2)
+    cache.record("a.example", "json_ld")
+    cache.record("b.example", "article")
+    cache.get("a.example")
+    cache.record("c.example", "trafilatura")
+    assert cache.get("b.example") is None
+    assert cache.get("a.example") == "json_ld"
+    assert cache.get("c.example") is None
+    assert len(cache) == 2
@@ -0,0 +1,80 @@
+"""Tests for link normalization."""
+
+import pytest
+
+from botbrowser.links import LinkNormalizer
+
+
+BASE = "https://www.example.com/blog/post/"
+
+
+@pytest.mark.parametrize(
+    "href, expected",
+    [
+        ("/about", "https://www.example.com/about"),
+        ("about", "https://www.example.com/blog/post/about"),
+        ("../tags", "https://www.example.com/blog/tags"),
+        ("?page=2", "https://www.example.com/blog/post?page=2"),
+        ("//cdn.example.com/a.html", "https://cdn.example.com/a.html"),
+        ("  /padded  ", "https://www.example.com/padded"),
+        ("HTTPS://WWW.Example.COM/Path", "https://www.example.com/Path"),
+        ("https://www.example.com:443/a", "https://www.example.com/a"),
+        ("http://www.example.com:80/a", "http://www.example.com/a"),
+        ("http://www.example.com:8080/a", "http://www.example.com:8080/a"),
+        ("https://www.example.com", "https://www.example.com/"),
+        ("https://www.example.com/a/", "https://www.example.com/a"),
+        ("https://www.example.com/a?b=2&a=1", "https://www.example.com/a?a=1&b=2"),
+        ("https://www.example.com/a?utm_source=x&id=7&fbclid=y&UTM_Campaign=z", "https://www.example.com/a?id=7"),
+        ("https://www.example.com/a?utm_source=x", "https://www.example.com/a"),
+        ("https://www.example.com/a?q=a%20b&x=", "https://www.example.com/a?q=a%20b&x="),
+        ("https://other.example.com/page#section", "https://other.example.com/page"),
+        ("http://[::1]:80/a", "http://[::1]/a"),
+    ],
+)
+def test_canonical_form(href, expected):
+    assert LinkNormalizer(BASE)(href) == expected
+
+
+@pytest.mark.parametrize(
+    "href",
+    [
+        "",
+        "#top",
+        "https://www.example.com/blog/post/#comments",
+        "mailto:someone@example.com",
+        "tel:+15555550100",
+        "javascript:void(0)",
+        "ftp://files.example.com/a",
+        "http://bad-port.example.com:port/",
+        "https:///no-host",
+    ],
+)
+def test_skipped_links(href):
+    assert LinkNormalizer(BASE)(href) is None
+
+
+def test_variants_share_one_canonical_form():
+    normalize = LinkNormalizer(BASE)
+    variants = [
+        "/article/1",
+        "https://www.example.com/article/1/",
+        "HTTPS://WWW.EXAMPLE.COM:443/article/1",
+        "https://www.example.com/article/1?utm_source=home&utm_medium=web",
+        "https://www.example.com/article/1#comments",
+    ]
+    assert {normalize(v) for v in variants} == {"https://www.example.com/article/1"}
+
+
+def test_custom_tracking_params():
+    normalize = LinkNormalizer(BASE, tracking_params=["ref", "session*"])
+    assert normalize("/a?ref=home&sessionid=1&utm_source=x") == "https://www.example.com/a?utm_source=x"
+
+
+def test_keep_trailing_slash():
+    normalize = LinkNormalizer(BASE, strip_trailing_slash=False)
+    assert normalize("/a/") == "https://www.example.com/a/"
+
+
+def test_results_are_cached():
+    normalize = LinkNormalizer(BASE)
+    assert normalize("/a?utm_source=x") is normalize("/a?utm_source=x")
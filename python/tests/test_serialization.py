@@ -0,0 +1,166 @@
+"""Tests for binary records, JSON helpers and result files."""
+
+import pytest
+
+from botbrowser.models import BotBrowserResult, ExtractedLink, ExtractionMetadata
+from botbrowser.serialization import (
+    FILE_MAGIC,
+    ResultReader,
+    ResultWriter,
+    dumps_json,
+    from_bytes,
+    loads_json,
+    to_bytes,
+)
+
+
+def _result(i: int = 0, **overrides) -> BotBrowserResult:
+    fields = dict(
+        url=f"https://example.com/page/{i}",
+        title=f"Page {i} — ünïcode",
+        description="A page",
+        content="# Heading\n\nBody text " * 20,
+        text_content="Heading\n\nBody text " * 20,
+        links=[
+            ExtractedLink(text="Home", href="https://example.com/"),
+            ExtractedLink(text="Café", href="https://example.com/caf%C3%A9"),
+        ],
+        metadata=ExtractionMetadata(
+            raw_token_estimate=1000,
+            clean_token_estimate=200,
+            token_savings_percent=80,
+            word_count=150,
+            fetched_at="2024-01-01T00:00:00+00:00",
+            extraction_path="article",
+        ),
+    )
+    fields.update(overrides)
+    return BotBrowserResult(**fields)
+
+
+def test_roundtrip():
+    result = _result()
+    assert from_bytes(to_bytes(result)) == result
+    assert BotBrowserResult.from_bytes(result.to_bytes()) == result
+
+
+def test_roundtrip_ascii_links_and_no_links():
+    ascii_links = _result(links=[ExtractedLink(text=f"L{i}", href=f"https://e.com/{i}") for i in range(50)])
+    assert from_bytes(to_bytes(ascii_links)) == ascii_links
+
+    no_links = _result(links=[])
+    assert from_bytes(to_bytes(no_links)) == no_links
+
+
+def test_from_bytes_accepts_memoryview():
+    result = _result()
+    data = b"xx" + to_bytes(result)
+    assert from_bytes(memoryview(data)[2:]) == result
+
+
+def test_binary_smaller_than_json():
+    result = _result()
+    assert len(to_bytes(result)) < len(result.model_dump_json())
+
+
+def test_invalid_records_raise():
+    data = to_bytes(_result())
+    with pytest.raises(ValueError, match="Not a BotBrowser record"):
+        from_bytes(b"XYZ" + data[3:])
+    with pytest.raises(ValueError, match="version"):
+        from_bytes(data[:3] + b"\x09" + data[4:])
+    with pytest.raises(ValueError, match="Truncated"):
+        from_bytes(data[:-1])
+    with pytest.raises(ValueError, match="Truncated"):
+        from_bytes(data[:6])
+
+
+def test_json_helpers():
+    assert loads_json(dumps_json({"a": [1, "é"]})) == {"a": [1, "é"]}
+    result = _result()
+    assert BotBrowserResult.model_validate(loads_json(dumps_json(result))) == result
+
+
+def test_camel_case_keys_accepted():
+    data = _result().model_dump()
+    data["textContent"] = data.pop("text_content")
+    data["metadata"] = {
+        "rawTokenEstimate": 10,
+        "cleanTokenEstimate": 5,
+        "tokenSavingsPercent": 50,
+        "wordCount": 4,
+        "fetchedAt": "now",
+    }
+    result = BotBrowserResult.model_validate(data)
+    assert result.text_content == _result().text_content
+    assert result.metadata.clean_token_estimate == 5
+    assert result.metadata.fetched_at == "now"
+
+
+def test_result_file_roundtrip(tmp_path):
+    path = tmp_path / "results.bbr"
+    results = [_result(i) for i in range(5)]
+    with ResultWriter(path) as writer:
+        offsets = [writer.append(r) for r in results]
+
+    with ResultReader(path) as reader:
+        records = list(reader)
+        assert [r.offset for r in records] == offsets
+        assert [r.url for r in records] == [r.url for r in results]
+        assert records[3].title == results[3].title
+        assert records[0].metadata == results[0].metadata
+        assert list(reader.results()) == results
+        del records
+
+
+def test_result_file_appends_across_writers(tmp_path):
+    path = tmp_path / "results.bbr"
+    with ResultWriter(path) as writer:
+        writer.append(_result(0))
+    with ResultWriter(path) as writer:
+        writer.append(_result(1))
+
+    assert path.read_bytes().count(FILE_MAGIC) == 1
+    with ResultReader(path) as reader:
+        assert [r.url for r in reader.results()] == [_result(0).url, _result(1).url]
+
+
+@pytest.mark.parametrize("cut", [10, 2])
+def test_partial_tail_ignored_and_sealed(tmp_path, cut):
+    path = tmp_path / "results.bbr"
+    with ResultWriter(path) as writer:
+        writer.append(_result(0))
+        writer.append(_result(1))
+    # Simulate a writer that crashed partway through its last frame
+    # (cut=2 leaves a partial length prefix)
+    data = path.read_bytes()
+    size = len(data) - len(to_bytes(_result(1))) - 4 + cut
+    path.write_bytes(data[:size])
+
+    reader = ResultReader(path)
+    assert [r.url for r in reader.results()] == [_result(0).url]
+
+    # The tail is sealed in place, never truncated under the open map
+    with ResultWriter(path) as writer:
+        offset = writer.append(_result(2))
+    assert offset >= size + 4
+    assert [r.url for r in reader.results()] == [_result(0).url]
+    reader.close()
+
+    with ResultReader(path) as reader:
+        assert [r.url for r in reader.results()] == [_result(0).url, _result(2).url]
+        assert [r.offset for r in reader][-1] == offset
+
+
+def test_empty_and_invalid_files(tmp_path):
+    path = tmp_path / "results.bbr"
+    ResultWriter(path).close()
+    with ResultReader(path) as reader:
+        assert list(reader) == []
+
+    bad = tmp_path / "bad.bbr"
+    bad.write_bytes(b"not a result file")
+    with pytest.raises(ValueError, match="Not a BotBrowser result file"):
+        ResultReader(bad)
+    with pytest.raises(ValueError):
+        ResultWriter(bad)
@@ -0,0 +1,176 @@
+"""Tests for streaming section-by-section extraction."""
+
+import asyncio
+import threading
+
+import pytest
+
+import botbrowser.streaming as streaming
+from botbrowser.core import extract_from_html
+from botbrowser.fastpath import domain_paths
+from botbrowser.fetcher import FetchResult
+from botbrowser.streaming import aiter_extract, iter_extract_from_html
+
+
+PROSE = "Ordinary article prose that goes on long enough to be kept as main content. " * 3
+
+PAGE_HTML = f"""
+<html><head><title>Guide</title></head>
+<body>
+    <nav><a href="/">Home</a></nav>
+    <article>
+        <p>Intro before any heading. {PROSE}</p>
+        <h1>Guide</h1>
+        <h2>Install</h2>
+        <p>Install it. {PROSE}</p>
+        <h3>From source</h3>
+        <p>Build it. {PROSE}</p>
+        <h2>Usage</h2>
+        <p>Use it. {PROSE}</p>
+        <ul><li>One</li><li>Two</li></ul>
+    </article>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_domain_paths():
+    domain_paths.clear()
+    yield
+    domain_paths.clear()
+
+
+def test_sections_follow_headings():
+    sections = list(iter_extract_from_html(PAGE_HTML, "https://docs.example/guide"))
+    assert [s.heading_path for s in sections] == [
+        [],
+        ["Guide", "Install"],
+        ["Guide", "Install", "From source"],
+        ["Guide", "Usage"],
+    ]
+    assert [s.index for s in sections] == [0, 1, 2, 3]
+    assert [s.level for s in sections] == [0, 2, 3, 2]
+    assert sections[0].heading == ""
+    assert sections[1].content.startswith("# Guide\n\n## Install\n\nInstall it.")
+    assert sections[3].content.endswith("- One\n- Two")
+    assert all(s.token_estimate == -(-len(s.content) // 4) for s in sections)
+
+
+EXPECTED_PATHS = [
+    [],
+    ["Guide", "Install"],
+    ["Guide", "Install", "From source"],
+    ["Guide", "Usage"],
+]
+
+
+@pytest.mark.parametrize(
+    "opening, closing",
+    [
+        ("<article class='post'>", "</article>"),
+        ("<main id='main'>", "</main>"),
+        ("<article class='post'><div class='entry-content'>", "</div></article>"),
+    ],
+)
+def test_sections_with_attributed_wrappers(opening, closing):
+    html = PAGE_HTML.replace("<article>", opening).replace("</article>", closing)
+    sections = list(iter_extract_from_html(html, "https://docs.example/guide"))
+    assert [s.heading_path for s in sections] == EXPECTED_PATHS
+
+
+def test_sections_on_trafilatura_path():
+    html = PAGE_HTML.replace("<article>", "<div class='content'>").replace("</article>", "</div>")
+    sections = list(iter_extract_from_html(html, "https://docs.example/guide", fast_path=False))
+    assert [s.heading_path for s in sections] == EXPECTED_PATHS
+    assert sections[3].content.endswith("- One\n- Two")
+
+
+def test_headings_inside_other_blocks_start_sections():
+    cards = "".join(f"<li><h3>Card {i}</h3><p>Card body {i}.</p></li>" for i in range(2))
+    html = f"<html><body><main><h2>Cards</h2><ul class='cards'>{cards}</ul></main></body></html>"
+    sections = list(iter_extract_from_html(html, fast_path=False))
+    assert [s.heading_path for s in sections] == [["Cards", "Card 0"], ["Cards", "Card 1"]]
+    assert sections[1].content == "### Card 1\n\nCard body 1."
+
+
+def test_sections_join_to_extract_content():
+    sections = iter_extract_from_html(PAGE_HTML, "https://docs.example/guide")
+    result = extract_from_html(PAGE_HTML, "https://docs.example/guide")
+    assert "\n\n".join(s.content for s in sections) == result.content
+
+
+def test_text_format():
+    sections = list(iter_extract_from_html(PAGE_HTML, format="text"))
+    assert sections[1].content.startswith("Guide\n\nInstall\n\nInstall it.")
+    assert "#" not in "".join(s.content for s in sections)
+
+
+def test_stopping_early_skips_conversion(monkeypatch):
+    converted = []
+    original = streaming.html_to_markdown
+
+    def counting(html):
+        converted.append(html)
+        return original(html)
+
+    monkeypatch.setattr(streaming, "html_to_markdown", counting)
+    sections = iter_extract_from_html(PAGE_HTML, "https://docs.example/guide")
+    first = next(sections)
+    sections.close()
+
+    assert first.heading_path == []
+    # The intro plus the heading that ended it — nothing after it
+    assert len(converted) == 2
+
+
+def test_empty_html_yields_nothing():
+    assert list(iter_extract_from_html("")) == []
+
+
+def test_aiter_extract(monkeypatch):
+    async def fake_fetch(url, **kwargs):
+        return FetchResult(html=PAGE_HTML, final_url=url, status_code=200, content_type="text/html")
+
+    monkeypatch.setattr(streaming, "fetch_page_async", fake_fetch)
+
+    async def collect():
+        sections = []
+        async for section in aiter_extract("https://docs.example/guide"):
+            sections.append(section)
+            if len(sections) == 2:
+                break
+        return sections
+
+    sections = asyncio.run(collect())
+    assert [s.heading_path for s in sections] == [[], ["Guide", "Install"]]
+
+
+def test_aiter_extract_cancel_during_step(monkeypatch):
+    async def fake_fetch(url, **kwargs):
+        return FetchResult(html=PAGE_HTML, final_url=url, status_code=200, content_type="text/html")
+
+    started = threading.Event()
+    release = threading.Event()
+    closed = []
+
+    def slow_sections(*args, **kwargs):
+        try:
+            started.set()
+            release.wait(5)
+            yield from iter_extract_from_html(PAGE_HTML)
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(streaming, "fetch_page_async", fake_fetch)
+    monkeypatch.setattr(streaming, "iter_extract_from_html", slow_sections)
+
+    async def cancel_mid_step():
+        step = asyncio.ensure_future(aiter_extract("https://docs.example/guide").__anext__())
+        await asyncio.to_thread(started.wait, 5)
+        step.cancel()
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        with pytest.raises(asyncio.CancelledError):
+            await step
+
+    asyncio.run(cancel_mid_step())
+    assert closed == [True]